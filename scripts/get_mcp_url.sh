@@ -28,8 +28,15 @@ fi
 # Get domain from argument or default
 DOMAIN="${2:-your-domain.com}"
 
-# Calculate MD5 hash
-API_KEY_HASH=$(echo -n "$API_KEY" | md5sum | awk '{print $1}')
+# Optional salt (must match the server's MD5_SALT)
+SALT="${MD5_SALT:-}"
+
+# Calculate SHA-256 hash (same as server_remote.py)
+if command -v sha256sum &> /dev/null; then
+    API_KEY_HASH=$(printf '%s%s' "$SALT" "$API_KEY" | sha256sum | awk '{print $1}')
+else
+    API_KEY_HASH=$(printf '%s%s' "$SALT" "$API_KEY" | shasum -a 256 | awk '{print $1}')
+fi
 
 # Display results
 echo ""
@@ -43,7 +50,7 @@ echo -e "${BLUE}Domain:${NC}          $DOMAIN"
 echo ""
 echo -e "${GREEN}Endpoints:${NC}"
 echo -e "  ${BLUE}MCP (authenticated):${NC}  https://$DOMAIN/app/$API_KEY/$API_KEY_HASH/mcp"
-echo -e "  ${BLUE}Health (public):${NC}      https://$DOMAIN/health"
+echo -e "  ${BLUE}Health (public):${NC}      https://$DOMAIN/app/health"
 echo ""
 echo -e "${YELLOW}Note:${NC} Keep the MCP URL confidential. It contains authentication credentials."
 echo ""
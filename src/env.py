@@ -0,0 +1,42 @@
+"""
+Environment loading shared by the stdio and remote servers
+"""
+
+import os
+from pathlib import Path
+from typing import Dict
+
+from dotenv import dotenv_values
+
+_loaded = False
+
+
+def load_environment() -> None:
+    """
+    Load .env and .env.local into os.environ (.env.local takes precedence).
+
+    Files are read from the working directory and then from the source
+    directory (supports running from elsewhere). Existing environment
+    variables are never overridden. The files are parsed once per process;
+    later calls are no-ops.
+    """
+    global _loaded
+
+    if _loaded:
+        return
+
+    config: Dict[str, str] = {}
+
+    script_dir = Path(__file__).parent
+    for directory in (Path("."), script_dir):
+        for filename in (".env", ".env.local"):
+            path = directory / filename
+            if path.exists():
+                config.update(dotenv_values(path))
+
+    # Apply loaded values without overriding existing environment vars
+    for key, value in config.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+    _loaded = True
@@ -5,38 +5,23 @@ A specialized MCP server for iCalendar feed management and event queries
 """
 
 import os
+import json
 import logging
-from typing import Optional, Dict, Any
-from dotenv import dotenv_values
-from pathlib import Path
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from fastmcp import FastMCP
 
+from .env import load_environment
+
 # Import our service modules
 from .services.ical import MultiCalendarService
 from .services.cache import RedisCache
 
 # Load environment variables with correct precedence
-config: Dict[str, str] = {}
-
-# Load from project directory if available
-for filename in (".env", ".env.local"):
-    path = Path(filename)
-    if path.exists():
-        config.update(dotenv_values(path))
-
-# Also check the script's directory (supports running from elsewhere)
-script_dir = Path(__file__).parent
-for filename in (".env", ".env.local"):
-    path = script_dir / filename
-    if path.exists():
-        config.update(dotenv_values(path))
-
-# Apply loaded values without overriding existing environment vars
-for key, value in config.items():
-    os.environ.setdefault(key, value)
+load_environment()
 
 # Configure logging
 logging.basicConfig(
@@ -50,6 +35,17 @@ logger = logging.getLogger(__name__)
 # Initialize MCP server
 mcp = FastMCP(name="CalendarMCP")
 
+# Day names by datetime.weekday(), independent of the process locale
+WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
 # Service instances (will be initialized on first use)
 _ical_service: Optional[MultiCalendarService] = None
 _ical_service_config: Optional[str] = (
@@ -80,8 +76,6 @@ def get_ical_service() -> Optional[MultiCalendarService]:
             logger.warning("No iCalendar feeds configured")
             return None
 
-        import json
-
         # Check if this is a Name="[JSON]" format (malformed but common)
         if "=" in configs_str and ('"[' in configs_str or "'[" in configs_str):
             # Extract the JSON part after the equals sign
@@ -169,6 +163,7 @@ def get_ical_service() -> Optional[MultiCalendarService]:
                 refresh_interval_minutes=refresh_interval,
                 mcp=mcp,  # Pass MCP instance to service
                 cache=cache,  # Pass cache instance to service
+                max_feed_bytes=int(os.getenv("MAX_FEED_SIZE_MB", "50")) * 1024 * 1024,
             )
             _ical_service_config = current_config  # Save the config that was used
             logger.info(
@@ -201,29 +196,37 @@ def get_cache_service() -> Optional[RedisCache]:
     return _cache_service
 
 
-def get_current_datetime() -> Dict[str, Any]:
-    """Get the current date and time in the configured timezone"""
-    # Get timezone from environment variable, default to UTC
-    timezone_str = os.getenv("TIMEZONE", "UTC")
+@lru_cache(maxsize=16)
+def _resolve_timezone(timezone_str: str) -> Tuple[ZoneInfo, str]:
+    """Timezone for a name and the name in effect, UTC when the name is invalid
 
+    Cached so an invalid name is looked up and warned about only once.
+    """
     try:
-        tz = ZoneInfo(timezone_str)
+        return ZoneInfo(timezone_str), timezone_str
     except Exception as e:
         logger.warning(f"Invalid timezone '{timezone_str}': {e}. Falling back to UTC.")
-        tz = ZoneInfo("UTC")
-        timezone_str = "UTC"
+        return ZoneInfo("UTC"), "UTC"
+
+
+def get_current_datetime() -> Dict[str, Any]:
+    """Get the current date and time in the configured timezone"""
+    # Get timezone from environment variable, default to UTC
+    tz, timezone_str = _resolve_timezone(os.getenv("TIMEZONE", "UTC"))
 
     # Get current datetime in the configured timezone
     now = datetime.now(tz)
+    # YYYY-MM-DDTHH:MM:SS..., the date and time are slices of it
+    iso = now.isoformat()
 
     return {
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "datetime": now.isoformat(),
+        "date": iso[:10],
+        "time": iso[11:19],
+        "datetime": iso,
         "timezone": timezone_str,
         "utc_offset": now.strftime("%z"),
         "timezone_abbr": now.strftime("%Z"),
-        "day_of_week": now.strftime("%A"),
+        "day_of_week": WEEKDAY_NAMES[now.weekday()],
         "timestamp": int(now.timestamp()),
     }
 
@@ -284,11 +287,11 @@ def get_server_status() -> Dict[str, Any]:
     # Check iCalendar service
     ical_service = get_ical_service()
     if ical_service:
-        info = ical_service.get_calendar_info()
+        # Read the counts directly; get_calendar_info walks every calendar
         status["services"]["icalendar"] = {
             "status": "active",
-            "feeds": info.get("total_feeds", 0),
-            "refresh_interval": info.get("refresh_interval_minutes", 60),
+            "feeds": len(ical_service.feeds),
+            "refresh_interval": ical_service.refresh_interval // 60,
         }
     else:
         status["services"]["icalendar"] = {"status": "not_configured"}
@@ -7,30 +7,146 @@ Optimized for scale-to-zero scenarios with lazy initialization
 
 import os
 import sys
+import atexit
 import logging
+import queue
 import hashlib
+import hmac
 import asyncio
-from dotenv import load_dotenv
+import json
+import time
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from starlette.routing import get_route_path
 
-# Load environment variables
-load_dotenv(".env.local")
-load_dotenv(".env")
+from .env import load_environment
 
-# Configure logging
-logging.basicConfig(
-    level=(
+# Load environment variables (parsed once; the server module reuses them)
+load_environment()
+
+
+def _configure_logging():
+    """
+    Configure root logging through a queue so async request handlers never
+    block on stream I/O. A background listener thread owns the real handler
+    and does the formatting. Like logging.basicConfig, this is a no-op when
+    the root logger already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    root.setLevel(
         logging.DEBUG if os.getenv("DEBUG", "false").lower() == "true" else logging.INFO
-    ),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+    )
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+# Configure logging
+_configure_logging()
 logger = logging.getLogger(__name__)
 
-# Get API key from environment (optional)
-api_key = os.getenv("MCP_API_KEY")
-md5_salt = os.getenv("MD5_SALT", "")
 
-# Track initialization state for lazy loading
+@dataclass(frozen=True)
+class RemoteConfig:
+    """Remote server settings, read from the environment once at startup"""
+
+    api_key: Optional[str]
+    md5_salt: str
+    host: str
+    port: int
+    workers: int
+    ical_feeds_configured: bool
+
+    @classmethod
+    def from_env(cls) -> "RemoteConfig":
+        """Create RemoteConfig from environment variables"""
+        return cls(
+            api_key=os.getenv("MCP_API_KEY"),  # optional
+            md5_salt=os.getenv("MD5_SALT", ""),
+            # Binding to all interfaces is required for container orchestration; enforce via HOST env var.
+            host=os.getenv("HOST", "0.0.0.0"),  # nosec B104
+            port=int(os.getenv("PORT", "8080")),
+            # Same variable the uvicorn CLI reads for --workers
+            workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+            ical_feeds_configured=bool(os.getenv("ICAL_FEED_CONFIGS")),
+        )
+
+
+config = RemoteConfig.from_env()
+api_key = config.api_key
+
+# Security headers added to every response, pre-encoded for the ASGI layer
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"no-referrer"),
+    (b"cache-control", b"no-store, no-cache, must-revalidate, private"),
+)
+
+# Headers dropped from every response: server identification headers plus any
+# upstream value for a security header (ours replaces it)
+_STRIPPED_HEADERS = frozenset(
+    {b"server", b"x-powered-by"} | {name for name, _ in _SECURITY_HEADERS}
+)
+
+# Uvicorn settings shared by both modes when run directly
+_UVICORN_OPTIONS = {
+    "loop": "uvloop",  # Use uvloop for better performance
+    "http": "httptools",  # Use httptools for faster HTTP parsing
+    "log_level": "warning",
+    "access_log": False,  # Disable access logs to prevent API key leakage
+    "server_header": False,
+    "date_header": False,  # Skip per-response date formatting
+    "proxy_headers": False,  # Nothing reads X-Forwarded-* headers
+}
+
+# Public health check path (never triggers service initialization)
+_HEALTH_PATH = "/app/health"
+
+# Health check bodies keyed by initialization state, serialized once
+_HEALTH_BODIES = {
+    initialized: json.dumps(
+        {"status": "healthy", "initialized": initialized, "version": "2.0.0"},
+        separators=(",", ":"),
+    ).encode()
+    for initialized in (False, True)
+}
+
+# Complete health check response headers, including the security headers
+_HEALTH_HEADERS = {
+    initialized: (
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        *_SECURITY_HEADERS,
+    )
+    for initialized, body in _HEALTH_BODIES.items()
+}
+
+# Minimum seconds between invalid-path warnings, so a scan cannot turn
+# into a logging flood
+_NOT_FOUND_LOG_INTERVAL = 1.0
+_last_not_found_log = 0.0
+
+# Track initialization state for lazy loading. The flag is read without the
+# lock on the hot path; the lock only serializes the cold path.
 _services_initialized = False
+_init_lock = threading.Lock()
 
 
 def lazy_initialize_services():
@@ -43,23 +159,210 @@ def lazy_initialize_services():
     if _services_initialized:
         return
 
-    logger.info("Lazy initializing services on first request...")
+    with _init_lock:
+        # Another thread may have finished initializing while we waited
+        if _services_initialized:
+            return
+
+        logger.info("Lazy initializing services on first request...")
+
+        from .server import initialize_services
+
+        initialize_services()
 
-    from .server import initialize_services
+        _services_initialized = True
+        logger.info("Services initialized successfully")
+
+
+def _warm_services():
+    """Initialize services in the background, logging rather than raising"""
+    try:
+        lazy_initialize_services()
+    except Exception as e:
+        logger.error(f"Background service initialization failed: {e}")
+
+
+def with_service_warmup(lifespan):
+    """
+    Wrap an app lifespan so services start initializing in a background
+    thread as soon as the server starts. Startup is not delayed, and by
+    the time the first MCP request arrives initialization has usually
+    finished, so LazyInitMiddleware finds the services ready.
+    """
 
-    initialize_services()
+    @asynccontextmanager
+    async def warmup_lifespan(app):
+        threading.Thread(
+            target=_warm_services, name="service-warmup", daemon=True
+        ).start()
+        async with lifespan(app) as state:
+            yield state
 
-    _services_initialized = True
-    logger.info("Services initialized successfully")
+    return warmup_lifespan
+
+
+def run_uvicorn(app):
+    """
+    Run the app with uvicorn using the configured host, port and workers.
+    Each worker is a separate process with its own lazily initialized
+    services. Multiple workers require the import string form, so uvicorn
+    can import the app in each worker; the parent process binds the socket
+    once and the workers share it.
+    """
+    import uvicorn
+
+    target = "src.server_remote:app" if config.workers > 1 else app
+    uvicorn.run(
+        target,
+        host=config.host,
+        port=config.port,
+        workers=config.workers,
+        **_UVICORN_OPTIONS,
+    )
+
+
+def _should_log_not_found() -> bool:
+    """Allow at most one invalid-path warning per _NOT_FOUND_LOG_INTERVAL"""
+    global _last_not_found_log
+
+    now = time.monotonic()
+    if now - _last_not_found_log < _NOT_FOUND_LOG_INTERVAL:
+        return False
+
+    _last_not_found_log = now
+    return True
+
+
+class SecurityMiddleware:
+    """
+    Pure ASGI middleware that adds security headers to every HTTP response.
+    Avoids BaseHTTPMiddleware, which wraps each request in a task group and
+    streams the response body through a memory channel.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message):
+            if message["type"] == "http.response.start":
+                # Remove server identification headers and add security headers
+                headers = [
+                    header
+                    for header in message.get("headers", ())
+                    if header[0].lower() not in _STRIPPED_HEADERS
+                ]
+                headers.extend(_SECURITY_HEADERS)
+                message["headers"] = headers
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
+
+
+class HealthCheckMiddleware:
+    """
+    Outermost ASGI middleware that answers health checks directly, before
+    any other middleware or routing runs. Does NOT trigger service
+    initialization to keep cold starts fast.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["path"] == _HEALTH_PATH
+            and scope["method"] in ("GET", "HEAD")
+        ):
+            initialized = _services_initialized
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": _HEALTH_HEADERS[initialized],
+                }
+            )
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": (
+                        _HEALTH_BODIES[initialized] if scope["method"] == "GET" else b""
+                    ),
+                }
+            )
+            return
+
+        await self.app(scope, receive, send)
+
+
+class MCPMountMiddleware:
+    """
+    ASGI dispatcher that sends requests under a fixed path prefix straight to
+    the MCP app, bypassing the wrapped app's router. Mirrors Starlette's
+    Mount: the path is kept and the prefix is appended to root_path.
+
+    The prefix carries the API key and its hash, so it is compared in
+    constant time rather than with an early-exit string match.
+    """
+
+    def __init__(self, app, mcp_app, prefix: str):
+        self.app = app
+        self.mcp_app = mcp_app
+        self.prefix = prefix
+        # Like Mount, only match paths below the prefix
+        self.match_prefix = f"{prefix}/".encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket") and hmac.compare_digest(
+            get_route_path(scope)[: len(self.match_prefix)].encode(),
+            self.match_prefix,
+        ):
+            root_path = scope.get("root_path", "")
+            scope = {
+                **scope,
+                "app_root_path": scope.get("app_root_path", root_path),
+                "root_path": root_path + self.prefix,
+            }
+            await self.mcp_app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class LazyInitMiddleware:
+    """Pure ASGI middleware that lazy-initializes services on first real request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Once initialized this is a single flag check; the health check is
+        # skipped so it stays fast during cold starts
+        if (
+            not _services_initialized
+            and scope["type"] == "http"
+            and scope["path"] != _HEALTH_PATH
+        ):
+            # Run off the event loop: initialization fetches feeds and may
+            # wait on the lock while the warmup thread finishes
+            await asyncio.to_thread(lazy_initialize_services)
+
+        await self.app(scope, receive, send)
 
 
 if api_key:
     # Use path-based authentication if API key is set
     logger.info("MCP_API_KEY is set - using path-based authentication")
 
-    from fastapi import FastAPI, Request, HTTPException
-    from fastapi.responses import Response
-    from starlette.middleware.base import BaseHTTPMiddleware
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
     from .server import mcp
 
     # Validate API key format (prevent path traversal attacks)
@@ -75,9 +378,9 @@ if api_key:
         )
 
     # Calculate hash of API key with optional salt for additional security layer
-    if md5_salt:
+    if config.md5_salt:
         logger.info("Using salt from MD5_SALT environment variable")
-        hash_input = f"{md5_salt}{api_key}"
+        hash_input = f"{config.md5_salt}{api_key}"
     else:
         logger.warning("No MD5_SALT configured - using unsalted hash")
         hash_input = api_key
@@ -88,13 +391,8 @@ if api_key:
         f"API key hash calculated: {api_key_hash[:8]}... (showing first 8 chars)"
     )
 
-    # Get configuration
-    port = int(os.getenv("PORT", "8080"))
-    # Binding to all interfaces is required for container orchestration; enforce via HOST env var.
-    host = os.getenv("HOST", "0.0.0.0")  # nosec B104
-
     # Check configuration
-    if not os.getenv("ICAL_FEED_CONFIGS"):
+    if not config.ical_feeds_configured:
         logger.warning(
             "No iCalendar feeds configured - will initialize on first request"
         )
@@ -102,112 +400,64 @@ if api_key:
     # DO NOT initialize services here - lazy init on first request
     # This allows the container to start immediately
 
-    # Security middleware to add headers
-    class SecurityMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request: Request, call_next):
-            response = await call_next(request)
-
-            # Add security headers
-            response.headers["X-Content-Type-Options"] = "nosniff"
-            response.headers["X-Frame-Options"] = "DENY"
-            response.headers["X-XSS-Protection"] = "1; mode=block"
-            response.headers["Referrer-Policy"] = "no-referrer"
-            response.headers["Cache-Control"] = (
-                "no-store, no-cache, must-revalidate, private"
-            )
-
-            # Remove server identification headers if they exist
-            if "server" in response.headers:
-                del response.headers["server"]
-            if "x-powered-by" in response.headers:
-                del response.headers["x-powered-by"]
-
-            return response
+    # Get the MCP HTTP app without a path since we'll mount it at /mcp
+    mcp_app = mcp.http_app(stateless_http=True)
 
-    # Middleware to lazy-initialize services on first real request
-    class LazyInitMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request: Request, call_next):
-            # Skip lazy init for health check (keeps it fast)
-            if request.url.path != "/app/health":
-                lazy_initialize_services()
+    # Empty 404 so any upstream (e.g. reverse proxy) can render its own
+    # 404 page. Built once and shared, since it carries no per-request state.
+    _NOT_FOUND = Response(status_code=404)
 
-            return await call_next(request)
+    # Custom 404 handler with anti-brute-force delay
+    async def not_found_handler(request: Request, exc: Exception):
+        # Add 30-second delay for failed authentication attempts to prevent brute forcing
+        # Only delay for /app/ paths that look like authentication attempts
+        path = request.url.path
+        if path.startswith("/app/") and path != _HEALTH_PATH:
+            if _should_log_not_found():
+                logger.warning(
+                    f"Invalid authentication path attempted: {path} from {request.client.host if request.client else 'unknown'}"
+                )
+            await asyncio.sleep(30)
 
-    # Get the MCP HTTP app without a path since we'll mount it at /mcp
-    mcp_app = mcp.http_app(stateless_http=True)
+        return _NOT_FOUND
 
-    # Create FastAPI app with security settings and MCP lifespan
-    app = FastAPI(
-        title="MattasMCP Remote Server",
-        docs_url=None,  # Disable Swagger UI
-        redoc_url=None,  # Disable ReDoc
-        openapi_url=None,  # Disable OpenAPI schema
-        lifespan=mcp_app.lifespan,  # REQUIRED: Connect MCP app's lifespan
+    # Bare Starlette app with no routes: it only runs the MCP app's lifespan
+    # and answers every other path with the 404 handler above. FastAPI's
+    # dependency injection and OpenAPI machinery would be pure overhead here.
+    app = Starlette(
+        exception_handlers={404: not_found_handler},
+        # REQUIRED: Connect MCP app's lifespan (plus background service warmup)
+        lifespan=with_service_warmup(mcp_app.lifespan),
     )
 
+    # Serve the MCP app at /app/{api_key}/{api_key_hash} without going through
+    # Starlette routing. The MCP app has internal routes like /mcp, /sse, etc.
+    app = MCPMountMiddleware(app, mcp_app, f"/app/{api_key}/{api_key_hash}")
+
     # Add middlewares (order matters - security first, then lazy init)
-    app.add_middleware(SecurityMiddleware)
-    app.add_middleware(LazyInitMiddleware)
+    app = SecurityMiddleware(app)
+    app = LazyInitMiddleware(app)
 
-    # Ultra-lightweight health check endpoint - no service initialization
+    # Ultra-lightweight health check - answered before anything else runs
     # This endpoint MUST be fast to pass health checks during cold starts
-    @app.get("/app/health")
-    async def health_check():
-        """
-        Lightweight health check endpoint for container orchestrators.
-        Does NOT trigger service initialization to keep cold starts fast.
-        """
-        return {
-            "status": "healthy",
-            "initialized": _services_initialized,
-            "version": "2.0.0",
-        }
-
-    # Mount the MCP app at /app/{api_key}/{api_key_hash}
-    # The MCP app has internal routes like /mcp, /sse, etc.
-    app.mount(f"/app/{api_key}/{api_key_hash}", mcp_app)
-
-    # Add a custom 404 handler with anti-brute-force delay
-    @app.exception_handler(404)
-    async def not_found_handler(request: Request, exc: HTTPException):
-        # Add 30-second delay for failed authentication attempts to prevent brute forcing
-        # Only delay for /app/ paths that look like authentication attempts
-        if request.url.path.startswith("/app/") and request.url.path != "/app/health":
-            logger.warning(
-                f"Invalid authentication path attempted: {request.url.path} from {request.client.host if request.client else 'unknown'}"
-            )
-            await asyncio.sleep(30)
-
-        # Return an empty 404 so any upstream (e.g. reverse proxy)
-        # can render its own 404 page.
-        return Response(status_code=404)
+    app = HealthCheckMiddleware(app)
 
     if __name__ == "__main__":
         # When run directly (not via uvicorn CLI)
-        import uvicorn
-
         logger.info(
             "Starting MattasMCP remote server with dual-factor path authentication"
         )
         logger.info(
-            f"MCP endpoint: http://{host}:{port}/app/{api_key}/{api_key_hash}/mcp"
+            f"MCP endpoint: http://{config.host}:{config.port}/app/{api_key}/{api_key_hash}/mcp"
+        )
+        logger.info(
+            f"Health check (public): http://{config.host}:{config.port}{_HEALTH_PATH}"
         )
-        logger.info(f"Health check (public): http://{host}:{port}/app/health")
         logger.info(f"API Key Hash: {api_key_hash}")
         logger.warning("Keep your API key secret and use HTTPS in production!")
         logger.info("Services will initialize lazily on first MCP request")
 
-        uvicorn.run(
-            app,
-            host=host,
-            port=port,
-            loop="uvloop",  # Use uvloop for better performance
-            http="httptools",  # Use httptools for faster HTTP parsing
-            log_level="warning",
-            access_log=False,  # Disable access logs to prevent API key leakage
-            server_header=False,
-            date_header=False,
-        )
+        run_uvicorn(app)
 
 else:
     # Use simple unauthenticated mode if no API key is set
@@ -218,28 +468,25 @@ else:
 
     # DO NOT initialize services here - lazy init on first request
 
-    # For unauthenticated mode, we still use the mcp.run() method
-    # but we should avoid eager initialization
-    if __name__ == "__main__":
-        # Get configuration
-        port = int(os.getenv("PORT", "8080"))
-        # Binding to all interfaces is required for container orchestration; enforce via HOST env var.
-        host = os.getenv("HOST", "0.0.0.0")  # nosec B104
+    # Serve the bare MCP HTTP app; services warm up in the background on startup
+    app = mcp.http_app()
+    app.router.lifespan_context = with_service_warmup(app.router.lifespan_context)
 
+    if __name__ == "__main__":
+        # When run directly (not via uvicorn CLI)
         # Check configuration
-        if not os.getenv("ICAL_FEED_CONFIGS"):
+        if not config.ical_feeds_configured:
             logger.warning(
                 "No iCalendar feeds configured - will initialize on first request"
             )
 
-        # For unauthenticated mode, let FastMCP handle everything
-        # FastMCP will initialize services when needed
         logger.info("Starting MattasMCP remote server (UNAUTHENTICATED)")
-        logger.info(f"MCP endpoint: http://{host}:{port}/mcp")
+        logger.info(f"MCP endpoint: http://{config.host}:{config.port}/mcp")
         logger.info(
             "Note: Set MCP_API_KEY environment variable to enable authentication"
         )
         logger.info("Services will initialize lazily on first MCP request")
 
-        # Start the server with HTTP transport
-        mcp.run(transport="http", host=host, port=port)
+        # Run through uvicorn directly (rather than mcp.run) so the same
+        # uvloop/httptools settings apply as in authenticated mode
+        run_uvicorn(app)
@@ -4,7 +4,9 @@ import hashlib
 import json
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from functools import wraps
@@ -14,8 +16,23 @@ import redis
 from redis import ConnectionPool, Redis, RedisError
 from redis.connection import SSLConnection
 
+try:
+    import orjson
+except ImportError:  # Optional, values go through the json module without it
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Make orjson write what json.dumps(value, default=str) writes: datetimes and
+# dataclasses through str(), non-string keys as strings
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_NON_STR_KEYS
+    if orjson is not None
+    else 0
+)
+
 T = TypeVar("T")
 
 
@@ -93,6 +110,9 @@ class CacheConfig:
     serialize_json: bool = True  # Use JSON serialization
     compress: bool = False  # Future: add compression support
     version: str = "v1"  # Cache version for key generation
+    # Recompute entries in the background once less than this fraction of
+    # their TTL is left, so hot keys are replaced before they expire (0 = off)
+    refresh_ahead: float = 0.0
 
     def get_ttl_seconds(self) -> int:
         """Get TTL in seconds"""
@@ -214,12 +234,22 @@ class RedisCache:
         """Serialize value for storage"""
         if value is None:
             return b""
+        if orjson is not None:
+            try:
+                return orjson.dumps(value, default=str, option=ORJSON_OPTIONS)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits, which json still takes
         return json.dumps(value, default=str).encode("utf-8")
 
     def _deserialize(self, data: bytes) -> Any:
         """Deserialize value from storage"""
         if not data:
             return None
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN written by json.dumps, which orjson rejects
         return json.loads(data.decode("utf-8"))
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -407,6 +437,44 @@ class RedisCache:
         self._connected = False
 
 
+class LocalTTLCache:
+    """Thread-safe in-process cache with per-entry TTLs and LRU eviction"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a value that has not expired yet"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl: int) -> None:
+        """Store a value for ttl seconds, evicting the least recently used"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def cache_key_generator(prefix: str, version: str = "v1", *args, **kwargs) -> str:
     """
     Generate cache key from function arguments
@@ -500,6 +568,13 @@ def cache_aside(
                 logger.debug(
                     f"Cache hit for {cache_key} ({time.time() - start_time:.3f}s)"
                 )
+                if config.refresh_ahead:
+                    remaining = cache.ttl(cache_key)
+                    threshold = config.get_ttl_seconds() * config.refresh_ahead
+                    if 0 <= remaining < threshold:
+                        _refresh_in_background(
+                            cache, cache_key, config, func, args, kwargs
+                        )
                 return cached_value
 
             # Cache miss - call function
@@ -522,6 +597,40 @@ def cache_aside(
     return decorator
 
 
+# Keys currently being recomputed by refresh-ahead
+_refreshing_keys: set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+def _refresh_in_background(
+    cache: RedisCache,
+    cache_key: str,
+    config: CacheConfig,
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+):
+    """Recompute a cache entry in a daemon thread, at most once at a time per key"""
+    with _refreshing_lock:
+        if cache_key in _refreshing_keys:
+            return
+        _refreshing_keys.add(cache_key)
+
+    def refresh():
+        try:
+            result = func(*args, **kwargs)
+            if result is not None:
+                cache.set(cache_key, result, ttl=config.get_ttl_seconds())
+            logger.debug(f"Refreshed {cache_key} ahead of expiry")
+        except Exception as e:
+            logger.warning(f"Refresh-ahead failed for {cache_key}: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing_keys.discard(cache_key)
+
+    threading.Thread(target=refresh, name="cache-refresh", daemon=True).start()
+
+
 def _invalidate_cache(
     cache_instance: RedisCache | None,
     config: CacheConfig,
@@ -582,11 +691,14 @@ class CacheTTL:
 
     Environment Variables:
         CACHE_TTL_CALENDAR_EVENTS: Calendar events cache (default: 900 seconds)
+        CACHE_TTL_CALENDAR_EVENTS_TODAY: Today's events cache (default: 60 seconds)
         CACHE_TTL_CALENDAR_INFO: Calendar info cache (default: 1800 seconds)
         CACHE_TTL_CALENDAR_FEED: Calendar feed cache (default: 600 seconds)
     """
 
     # Calendar
     CALENDAR_EVENTS = _get_cache_ttl("CALENDAR_EVENTS", 900)  # 15 minutes default
+    # Today's events change most often, so they get the shortest TTL (1 minute)
+    CALENDAR_EVENTS_TODAY = _get_cache_ttl("CALENDAR_EVENTS_TODAY", 60)
     CALENDAR_INFO = _get_cache_ttl("CALENDAR_INFO", 1800)  # 30 minutes default
     CALENDAR_FEED = _get_cache_ttl("CALENDAR_FEED", 600)  # 10 minutes default
@@ -1,9 +1,17 @@
 """Service for fetching and caching multiple named iCalendar feeds"""
 
 import logging
+import re
+import heapq
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Any
-from threading import Lock, Timer
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Tuple
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from functools import lru_cache, wraps
+from itertools import accumulate, count, islice, repeat
+from operator import attrgetter, itemgetter
+from threading import Lock, RLock, Thread, Timer
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from icalendar import Calendar, Event
 from dateutil import parser as date_parser
@@ -11,7 +19,13 @@ from dateutil.tz import UTC
 import hashlib
 import recurring_ical_events
 from typing import TYPE_CHECKING
-from .cache import cache_aside, CacheConfig, CacheTTL
+from .cache import (
+    cache_aside,
+    cache_key_generator,
+    CacheConfig,
+    CacheTTL,
+    LocalTTLCache,
+)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
@@ -19,18 +33,389 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of feeds fetched at the same time during a refresh
+MAX_FETCH_WORKERS = 8
+
+# Default limit on a feed's download size
+DEFAULT_MAX_FEED_BYTES = 50 * 1024 * 1024
+
+# Size of the pieces a feed body is downloaded in
+FEED_CHUNK_BYTES = 64 * 1024
+
+# Slack when preselecting single events for a date range. Floating times and
+# dates are placed in a timezone only during expansion, so the UTC spans
+# computed at parse time can be off by up to a day either way.
+EXPANSION_MARGIN = timedelta(days=2)
+
+# Properties that make a VEVENT part of a recurring series
+RECURRENCE_PROPERTIES = ("RRULE", "RDATE", "EXDATE", "RECURRENCE-ID")
+
+# Accepted severity_threshold values of the conflict analysis tool
+SEVERITY_THRESHOLDS = ("all", "high", "medium", "low")
+
+# Rank of each severity, "all" ranks below every conflict
+SEVERITY_LEVELS = {"all": 0, "low": 1, "medium": 2, "high": 3}
+
+# Tool arguments read as true for boolean flags
+TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+
+
+def _utc_midnight() -> datetime:
+    """Start of the current day in UTC"""
+    return datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _body_digest(content) -> bytes:
+    """Digest of a feed body, as downloaded or as persisted in the cache"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _parse_day(value: str) -> date:
+    """Parse a YYYY-MM-DD date
+
+    The canonical form goes through the much faster date.fromisoformat.
+    Anything else is left to strptime, which also takes unpadded months and
+    days and rejects the other ISO 8601 forms fromisoformat would accept.
+    """
+    if len(value) == 10 and value[4] == value[7] == "-":
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _utc_day_start(value: str) -> datetime:
+    """Midnight UTC at the start of a YYYY-MM-DD date"""
+    day = _parse_day(value)
+    return datetime(day.year, day.month, day.day, tzinfo=UTC)
+
+
+def _feed_field(feed: Optional[str]) -> Dict[str, str]:
+    """The "feed" entry of a resource result, present only when filtering"""
+    return {"feed": feed} if feed else {}
+
+
+def _today_events_key(service, feed_identifiers=None) -> str:
+    """Cache key for today's events that changes at midnight UTC"""
+    return cache_key_generator(
+        "ical:today",
+        "v1",
+        datetime.now(UTC).date(),
+        feed_identifiers=feed_identifiers,
+    )
+
+
+def _conflicts_key(
+    service,
+    days_ahead: int = 7,
+    include_all_day: bool = False,
+    min_overlap_minutes: int = 0,
+    severity_threshold: str = "all",
+) -> str:
+    """Cache key for a conflict analysis that changes with the date and feed contents
+
+    The analysis window starts today, so keys include the UTC date and a result
+    is never served across midnight.
+    """
+    return cache_key_generator(
+        "ical:conflicts",
+        "v1",
+        service._feeds_etag(),
+        datetime.now(UTC).date().isoformat(),
+        days_ahead=days_ahead,
+        include_all_day=include_all_day,
+        min_overlap_minutes=min_overlap_minutes,
+        severity_threshold=severity_threshold,
+    )
+
+
+@lru_cache(maxsize=256)
+def _search_terms(query_lower: str) -> Tuple[Tuple[str, ...], "re.Pattern[str]"]:
+    """Variations of a lowercased search query, and a regex matching any of them"""
+    variations = tuple(
+        dict.fromkeys(
+            (
+                query_lower,
+                query_lower.replace(" ", "_"),  # Handle underscore vs space
+                query_lower.replace("_", " "),  # Handle space vs underscore
+                query_lower.replace("-", " "),  # Handle hyphen vs space
+            )
+        )
+    )
+    return variations, re.compile("|".join(map(re.escape, variations)))
+
+
+# Source of CalendarFeed.version numbers, unique across all feeds
+_calendar_versions = count()
+
+
+def _memoize_resource(ttl: int):
+    """Reuse a resource method's result in-process for up to ttl seconds
+
+    Keys include the UTC date and the version of every feed's calendar, so a
+    result is never served across midnight or after any feed changes.
+    Error results are not stored.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (
+                method.__name__,
+                datetime.now(UTC).date(),
+                self._feeds_version(),
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+            result = self._resource_results.get(key)
+            if result is None:
+                result = method(self, *args, **kwargs)
+                if not (isinstance(result, dict) and "error" in result):
+                    self._resource_results.set(key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class RepeatingTimer(Timer):
+    """Timer that calls its function every interval until cancelled"""
+
+    def run(self):
+        while not self.finished.wait(self.interval):
+            self.function(*self.args, **self.kwargs)
+
+
+class ParsedEvent(NamedTuple):
+    """A VEVENT together with the values queries need from it"""
+
+    component: Event
+    event: Dict[str, Any]  # _event_to_dict output; copy before handing out
+    start: Optional[datetime]  # normalized UTC start
+    end: Optional[datetime]  # normalized UTC end, approximate; see EXPANSION_MARGIN
+    sort_key: Tuple[float, int]  # see MultiCalendarService._start_sort_key
+
+
+class EventSpan(NamedTuple):
+    """Normalized times of an event dictionary, worked out once for conflict checks"""
+
+    start: datetime  # UTC
+    end: datetime  # UTC
+    all_day: bool
+
+
+class FeedEvents:
+    """Parsed view of a feed's VEVENTs, built once per fetched calendar"""
+
+    def __init__(
+        self, calendar: Calendar, events: List[ParsedEvent], search_texts: List[str]
+    ):
+        self.calendar = calendar  # the calendar these events were parsed from
+        self.events = events  # calendar order
+        # Every event's search text in one string, so a search is a few regex
+        # scans over it rather than one call per event; event i's text starts
+        # at search_offsets[i] and ends before search_offsets[i + 1] - 1
+        self.search_text = "\0".join(search_texts)
+        self.search_offsets = list(
+            accumulate((len(text) + 1 for text in search_texts), initial=0)
+        )
+        self.by_start = sorted(
+            (e for e in events if e.start is not None), key=attrgetter("start")
+        )
+        self.starts = [e.start for e in self.by_start]
+        # First event per UID, matching a scan in calendar order, and its position
+        self.by_uid: Dict[str, ParsedEvent] = {}
+        self.uid_order: Dict[str, int] = {}
+        for index, e in enumerate(events):
+            uid = e.event["uid"] or ""
+            self.by_uid.setdefault(uid, e)
+            self.uid_order.setdefault(uid, index)
+
+        # Recurring series (and anything sharing a UID, which expansion treats
+        # as one series) always go through recurrence expansion; single events
+        # only when they can overlap the requested range
+        uid_counts = Counter(e.event["uid"] for e in events)
+        # X-WR-TIMEZONE moves times into another zone before expansion
+        direct = "X-WR-TIMEZONE" not in calendar
+        self.series: List[Tuple[int, Event]] = []
+        singles = []
+        for index, e in enumerate(events):
+            if (
+                e.start is None
+                or e.end is None
+                or uid_counts[e.event["uid"]] > 1
+                or any(prop in e.component for prop in RECURRENCE_PROPERTIES)
+            ):
+                self.series.append((index, e.component))
+            else:
+                span = self._occurrence_span(e.component) if direct else None
+                singles.append((e.start, index, e, span))
+        singles.sort(key=lambda single: single[:2])
+        self.singles = [(index, e, span) for _, index, e, span in singles]
+        self.single_starts = [start for start, _, _, _ in singles]
+        self.max_single_span = max(
+            (e.end - e.start for _, _, e, _ in singles), default=timedelta(0)
+        )
+
+    @staticmethod
+    def _occurrence_span(component: Event) -> Optional[Tuple[datetime, datetime]]:
+        """UTC start and end of a single event's only occurrence
+
+        None unless expansion would keep the event as is apart from setting
+        DTEND, which holds for timezone-aware datetimes ending after they start.
+        """
+        start = component["DTSTART"].dt
+        if not isinstance(start, datetime) or start.tzinfo is None:
+            return None
+        event_end = component.get("DTEND")
+        duration = component.get("DURATION")
+        if event_end is not None:
+            end = getattr(event_end, "dt", None)
+            if not isinstance(end, datetime) or end.tzinfo is None:
+                return None
+        elif duration is not None:
+            if not isinstance(getattr(duration, "dt", None), timedelta):
+                return None
+            end = start + duration.dt
+        else:
+            end = start
+        if end < start:
+            return None
+        return start.astimezone(UTC), end.astimezone(UTC)
+
+    def search(self, pattern: "re.Pattern[str]") -> Iterator[ParsedEvent]:
+        """Events whose search text matches pattern, in calendar order"""
+        text, offsets = self.search_text, self.search_offsets
+        pos = 0
+        while True:
+            match = pattern.search(text, pos)
+            if match is None:
+                return
+            index = bisect_right(offsets, match.start()) - 1
+            end = offsets[index + 1] - 1
+            # Only a pattern matching NUL can run into the next event, check
+            # the event on its own then
+            if match.end() <= end or pattern.search(text, offsets[index], end):
+                yield self.events[index]
+            pos = end + 1
+
+    def _nearby_singles(self, start: datetime, end: datetime):
+        """Single events starting close enough to overlap start..end"""
+        low = bisect_left(
+            self.single_starts, start - self.max_single_span - EXPANSION_MARGIN
+        )
+        high = bisect_right(self.single_starts, end + EXPANSION_MARGIN)
+        return self.singles[low:high]
+
+    def expansion_candidates(self, start: datetime, end: datetime) -> List[Event]:
+        """VEVENTs that need expanding for occurrences between start and end, in calendar order"""
+        candidates = list(self.series)
+        candidates.extend(
+            (index, e.component)
+            for index, e, span in self._nearby_singles(start, end)
+            if span is None and e.end + EXPANSION_MARGIN >= start
+        )
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [component for _, component in candidates]
+
+    def single_occurrences(
+        self, start: datetime, end: datetime
+    ) -> List[Tuple[int, ParsedEvent, datetime]]:
+        """Single events left out of expansion that occur between start and end
+
+        Uses the inclusion rule of recurring_ical_events: starts are inclusive,
+        ends exclusive, and zero-length events count at their start.
+        """
+        if start > end:
+            return []
+        occurrences = []
+        for index, e, span in self._nearby_singles(start, end):
+            if span is None:
+                continue
+            event_start, event_end = span
+            if event_start == event_end:
+                if start == end:
+                    hit = event_start == start
+                else:
+                    hit = start <= event_start < end
+            elif start == end:
+                hit = event_start <= start < event_end
+            else:
+                hit = event_start < end and start < event_end
+            if hit:
+                occurrences.append((index, e, event_end))
+        return occurrences
+
 
 class CalendarFeed:
     """Represents a named calendar feed"""
 
+    # No per-instance __dict__: feeds are read in every query's hot loops
+    __slots__ = (
+        "url",
+        "name",
+        "name_lower",
+        "id",
+        "_calendar",
+        "parsed",
+        "_last_fetch",
+        "last_fetch_iso",
+        "error",
+        "etag",
+        "last_modified",
+        "version",
+        "event_count",
+        "display_name",
+        "body_digest",
+    )
+
     def __init__(self, url: str, name: str = None):
         self.url = url
         self.name = name or self._generate_name_from_url(url)
-        # MD5 used only for a short, stable identifier (not for security)
-        self.id = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
+        self.name_lower = self.name.lower()  # for search matching
+        # Short, stable identifier (not for security): 4-byte BLAKE2b digest
+        self.id = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+        # Also sets parsed, version, body_digest, event_count and display_name
         self.calendar: Optional[Calendar] = None
         self.last_fetch: Optional[datetime] = None
         self.error: Optional[str] = None
+        # Validators from the last download, for conditional requests
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+
+    @property
+    def calendar(self) -> Optional[Calendar]:
+        """The fetched calendar"""
+        return self._calendar
+
+    @calendar.setter
+    def calendar(self, calendar: Optional[Calendar]) -> None:
+        # Parsed events belong to the previous calendar
+        self._calendar = calendar
+        self.parsed = None
+        # Changes whenever a calendar is published
+        self.version = next(_calendar_versions)
+        # Digest of the body the calendar was parsed from, set by refreshes
+        self.body_digest: Optional[bytes] = None
+        # Summaries read by the feed listings, taken once per calendar
+        if calendar is None:
+            self.event_count, self.display_name = 0, None
+        else:
+            self.event_count = len(calendar.walk("VEVENT"))
+            display_name = calendar.get("X-WR-CALNAME")
+            self.display_name = str(display_name) if display_name else None
+
+    @property
+    def last_fetch(self) -> Optional[datetime]:
+        """When the current calendar was fetched"""
+        return self._last_fetch
+
+    @last_fetch.setter
+    def last_fetch(self, last_fetch: Optional[datetime]) -> None:
+        # Formatted once here rather than by every feed listing
+        self._last_fetch = last_fetch
+        self.last_fetch_iso = last_fetch.isoformat() if last_fetch else None
 
     def _generate_name_from_url(self, url: str) -> str:
         """Generate a default name from URL"""
@@ -44,6 +429,314 @@ class CalendarFeed:
         return domain or "calendar"
 
 
+class FeedRegistry(Dict[str, CalendarFeed]):
+    """Feeds keyed by ID, with an index for lookups by URL or name"""
+
+    def __init__(self):
+        super().__init__()
+        # First registered feed whose URL or name equals the key
+        self._aliases: Dict[str, CalendarFeed] = {}
+
+    def __setitem__(self, feed_id: str, feed: CalendarFeed) -> None:
+        replaced = feed_id in self
+        super().__setitem__(feed_id, feed)
+        if replaced:
+            self._reindex()
+        else:
+            self._aliases.setdefault(feed.url, feed)
+            self._aliases.setdefault(feed.name, feed)
+
+    def __delitem__(self, feed_id: str) -> None:
+        super().__delitem__(feed_id)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._aliases = {}
+        for feed in self.values():
+            self._aliases.setdefault(feed.url, feed)
+            self._aliases.setdefault(feed.name, feed)
+
+    def find(self, identifier: str) -> Optional[CalendarFeed]:
+        """Find a feed by ID, URL, or name"""
+        return self.get(identifier) or self._aliases.get(identifier)
+
+
+# MCP tool descriptions, formatted once at import from the configured cache TTLs
+_TOOL_DESCRIPTIONS = {
+    "refresh_calendar_feeds": """Force refresh all calendar feeds to get the latest events.
+
+## Parameters
+None required
+
+## Returns
+• Success status
+• Current feed information, returned right away
+• The refresh runs in the background; later calls see its results
+
+## Use Cases
+• Get immediate updates from all calendar sources
+• Sync after adding new feeds
+• Refresh before important queries""",
+    "get_calendar_info": f"""Get information about all configured calendar feeds (cached for {CacheTTL.CALENDAR_INFO//60} minutes).
+
+## Returns
+• Status of each feed
+• Event counts per feed
+• Last update times
+• Total number of feeds
+• Refresh interval settings
+
+## Use Cases
+• Check feed health and status
+• See when feeds were last updated
+• Monitor feed event counts
+
+## Caching
+• Feed information cached for {CacheTTL.CALENDAR_INFO//60} minutes
+• Refreshed in the background shortly before it expires
+• Feed metadata doesn't change frequently""",
+    "get_today_events": f"""Get all calendar events happening today across all configured feeds (cached for {CacheTTL.CALENDAR_EVENTS_TODAY} seconds).
+
+## Returns
+• List of today's events
+• Event times and durations
+• Event locations and descriptions
+• Feed source for each event
+
+## Use Cases
+• Daily schedule overview
+• Check for conflicts today
+• Plan the current day
+
+## Related Tools
+• Use `get_tomorrow_events` for next day planning
+• Use `get_calendar_conflicts` to find overlapping events
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS_TODAY} seconds
+• Balances freshness with performance for calendar data""",
+    "get_upcoming_events": f"""Get the next 20 upcoming calendar events across all configured feeds (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Returns
+• Next 20 events sorted by start time
+• Event details (title, time, location)
+• Feed source for each event
+
+## Use Cases
+• Preview upcoming schedule
+• Long-term planning
+• Check future availability
+
+## Related Tools
+• Use `get_week_events` for current week only
+• Use `get_month_events` for current month view
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Recent events refreshed periodically""",
+    "get_events_on_date": f"""Get all calendar events on a specific date (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Parameters
+• date: Date in YYYY-MM-DD format (required)
+• feed: Specific feed name to filter (optional)
+  - Call `get_calendar_feeds` to see available feed names
+
+## Returns
+All events for the specified date
+
+## Use Cases
+• Check schedule for a specific day
+• Plan for future dates
+• Review past events
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Date-specific queries use cached event data""",
+    "get_events_between_dates": f"""Get all calendar events between two dates (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Parameters
+• start_date: Start date in YYYY-MM-DD format (required)
+• end_date: End date in YYYY-MM-DD format (required)
+• feed: Specific feed name to filter (optional)
+  - Call `get_calendar_feeds` to see available feed names
+
+## Returns
+All events between the specified dates
+
+## Use Cases
+• Get events for a custom date range
+• Plan vacations or trips
+• Review activity for a period
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Range queries use cached event data""",
+    "get_events_after_date": f"""Get all calendar events after a specific date (next 30 days) (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Parameters
+• date: Start date in YYYY-MM-DD format (required)
+• feed: Specific feed name to filter (optional)
+  - Call `get_calendar_feeds` to see available feed names
+
+## Returns
+Events for the next 30 days after the specified date
+
+## Use Cases
+• Look ahead from a specific date
+• Plan future activities
+• Check upcoming availability
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Future event queries use cached data""",
+    "search_calendar_events": f"""Search for calendar events by text (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Parameters
+• query: Search text (required)
+• feed: Specific feed name to filter (optional)
+  - Call `get_calendar_feeds` to see available feed names
+
+## Returns
+Events matching the search query in:
+• Title
+• Description
+• Location
+
+## Use Cases
+• Find specific meetings or events
+• Search for events at a location
+• Locate events with specific keywords
+
+## Caching
+• Search results cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Searches performed on cached event data""",
+    "get_calendar_feeds": """Get list of configured calendar feed names and URLs.
+
+## Returns
+• Feed names
+• Feed URLs
+• Feed configuration details
+
+## Use Cases
+• See available feeds before filtering
+• Get feed names for other tool parameters
+• Check feed URLs for removal""",
+    "get_week_events": f"""Get all calendar events for the current week (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Returns
+• All events from Monday to Sunday
+• Organized by day
+• Event times and details
+
+## Use Cases
+• Weekly planning
+• Week at a glance
+• Short-term scheduling
+
+## Related Tools
+• Use `get_today_events` for today only
+• Use `get_month_events` for broader view
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Week view uses cached event data""",
+    "get_month_events": f"""Get all calendar events for the current month (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Returns
+• All events for the current month
+• Organized by date
+• Event counts per day
+
+## Use Cases
+• Monthly overview
+• Long-term planning
+• Month-end reviews
+
+## Related Tools
+• Use `get_week_events` for current week
+• Use `get_events_between_dates` for custom ranges
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Month view uses cached event data""",
+    "get_tomorrow_events": f"""Get all calendar events for tomorrow (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Returns
+• Tomorrow's complete schedule
+• Event times and details
+• Feed sources
+
+## Use Cases
+• Next day preparation
+• Evening planning for tomorrow
+• Advance notifications
+
+## Related Tools
+• Use `get_today_events` for current day
+• Use `get_events_on_date` for other specific dates
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Tomorrow's events from cached data""",
+    "get_calendar_conflicts": f"""Get overlapping or conflicting events in the next 7 days (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Returns
+• List of conflicting event pairs
+• Overlap duration
+• Conflict details
+
+## Use Cases
+• Identify scheduling conflicts
+• Find double-booked time slots
+• Clean up calendar overlaps
+
+## Related Tools
+• Use `get_week_events` to see all events
+• Use `get_today_events` to check today's conflicts
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Conflict detection on cached events""",
+    "analyze_calendar_conflicts": f"""Analyze calendar conflicts with severity levels and advanced filtering (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
+
+## Parameters
+• days_ahead: Number of days to analyze (default: "7")
+• include_all_day: Include all-day events - "true"/"false" (default: "false")
+• min_overlap_minutes: Minimum overlap to report (default: "0")
+• severity_threshold: Filter by severity - "all", "high", "medium", "low" (default: "all")
+
+## Returns
+• Detailed conflict analysis with severity levels
+• Conflicts grouped by severity (high/medium/low)
+• Statistics and recommendations
+• Timezone information (UTC)
+
+## Severity Levels
+• High: Exact overlaps, >60min overlap, or >30min time conflicts
+• Medium: Partial overlaps between 15-60 minutes
+• Low: All-day overlaps, <15min overlaps, or tentative events
+
+## Use Cases
+• Focus on high-severity conflicts only
+• Filter out minor overlaps (e.g., min_overlap_minutes="30")
+• Exclude all-day events from analysis
+• Get scheduling recommendations
+
+## Examples
+• analyze_calendar_conflicts("30", "false", "15", "high") - Next 30 days, high severity only, min 15min overlap
+• analyze_calendar_conflicts("7", "true", "0", "all") - Next week, include all conflicts
+
+## Related Tools
+• Use `get_calendar_conflicts` for simple conflict list
+• Use `get_week_events` to see all events
+• Use `search_calendar_events` to find specific events
+
+## Caching
+• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
+• Advanced conflict analysis on cached events""",
+}
+
+
 class MultiCalendarService:
     """Service for fetching, caching, and querying multiple named iCalendar feeds"""
 
@@ -53,6 +746,7 @@ class MultiCalendarService:
         refresh_interval_minutes: int = 60,
         mcp: Optional["FastMCP"] = None,
         cache: Optional["RedisCache"] = None,
+        max_feed_bytes: int = DEFAULT_MAX_FEED_BYTES,
     ):
         """
         Initialize the multi-calendar service
@@ -60,13 +754,22 @@ class MultiCalendarService:
         Args:
             feed_configs: List of feed configurations with 'url' and optional 'name'
             refresh_interval_minutes: How often to refresh the cache (in minutes)
+            max_feed_bytes: Feeds larger than this are not downloaded
         """
-        self.feeds: Dict[str, CalendarFeed] = {}
+        self.feeds = FeedRegistry()
         self.refresh_interval = refresh_interval_minutes * 60  # Convert to seconds
+        self.max_feed_bytes = max_feed_bytes
+        # Guards publishing a feed's calendar and building its parsed view;
+        # queries read the published snapshots without it
         self._lock = Lock()
-        self._refresh_timer: Optional[Timer] = None
+        # Held for the duration of a full refresh; auto-refresh ticks that
+        # find it taken are dropped instead of queueing up behind it
+        self._refresh_lock = RLock()
+        self._refresh_timer: Optional[RepeatingTimer] = None
         self.mcp = mcp
         self.cache = cache
+        # In-process results of the event resources, see _memoize_resource
+        self._resource_results = LocalTTLCache(max_entries=256)
 
         # Initialize feeds
         for config in feed_configs:
@@ -77,8 +780,9 @@ class MultiCalendarService:
                 feed = CalendarFeed(url, name)
                 self.feeds[feed.id] = feed
 
-        # Perform initial fetch for all feeds
-        self.refresh_all_calendars()
+        # Perform initial fetch for all feeds, reusing feed bodies persisted
+        # in the cache by a previous process when they are still fresh
+        self.refresh_all_calendars(use_cached=True)
 
         # Schedule periodic refresh
         self._schedule_refresh()
@@ -119,7 +823,7 @@ class MultiCalendarService:
         """Validate date format"""
         if date_str is not None:
             try:
-                datetime.strptime(date_str, "%Y-%m-%d")
+                _parse_day(date_str)
             except ValueError:
                 raise ValueError(
                     f"Invalid {param_name} format: '{date_str}'.\n"
@@ -148,30 +852,52 @@ class MultiCalendarService:
         return feed
 
     def _schedule_refresh(self):
-        """Schedule the next automatic refresh"""
+        """Start the automatic refresh timer (a single long-lived daemon thread)"""
         if self._refresh_timer:
             self._refresh_timer.cancel()
 
-        self._refresh_timer = Timer(self.refresh_interval, self._auto_refresh)
+        self._refresh_timer = RepeatingTimer(self.refresh_interval, self._auto_refresh)
         self._refresh_timer.daemon = True
         self._refresh_timer.start()
 
     def _auto_refresh(self):
-        """Automatically refresh all calendars and reschedule"""
+        """Refresh all calendars in the background, unless a refresh is already running"""
+        if not self._refresh_lock.acquire(blocking=False):
+            logger.info("Skipping refresh: a refresh is already in progress")
+            return
+
         try:
             self.refresh_all_calendars()
         except Exception as e:
-            logger.error(f"Auto-refresh failed: {e}")
+            logger.error(f"Background refresh failed: {e}")
         finally:
-            self._schedule_refresh()
+            self._refresh_lock.release()
 
-    def refresh_all_calendars(self) -> Dict[str, Any]:
-        """Fetch and cache all calendars from the feed URLs"""
+    def refresh_all_calendars(self, use_cached: bool = False) -> Dict[str, Any]:
+        """Fetch and cache all calendars from the feed URLs concurrently
+
+        Args:
+            use_cached: Load feed bodies from the cache when available instead
+                of downloading them (used for the initial load)
+        """
+        feeds = list(self.feeds.values())
         results = []
 
-        for feed_id, feed in self.feeds.items():
-            result = self._refresh_single_calendar(feed)
-            results.append(result)
+        # One full refresh at a time, so overlapping refreshes never fetch
+        # the same feeds twice in parallel
+        with self._refresh_lock:
+            if feeds:
+                # Fetch in parallel so a refresh takes as long as the slowest
+                # feed rather than the sum of all of them
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_FETCH_WORKERS, len(feeds)),
+                    thread_name_prefix="ical-fetch",
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            self._refresh_single_calendar, feeds, repeat(use_cached)
+                        )
+                    )
 
         return {
             "status": "success",
@@ -195,124 +921,333 @@ class MultiCalendarService:
 
     def _find_feed(self, identifier: str) -> Optional[CalendarFeed]:
         """Find a feed by URL, name, or ID"""
-        if identifier in self.feeds:
-            return self.feeds[identifier]
+        return self.feeds.find(identifier)
+
+    def _feed_cache_key(self, feed: CalendarFeed) -> str:
+        """Cache key for a feed's persisted body"""
+        return f"ical:feed:{feed.id}"
+
+    def _load_cached_feed(self, feed: CalendarFeed) -> Optional[Dict[str, str]]:
+        """Load a feed body persisted by a previous fetch, if still cached"""
+        if self.cache is None:
+            return None
+
+        cached = self.cache.get(self._feed_cache_key(feed))
+        if not isinstance(cached, dict) or "content" not in cached:
+            return None
+        return cached
+
+    def _store_cached_feed(
+        self, feed: CalendarFeed, content: bytes, fetched_at: datetime
+    ) -> None:
+        """Persist a downloaded feed body so a restarted process can skip the download"""
+        if self.cache is None:
+            return
+
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            return
+
+        self.cache.set(
+            self._feed_cache_key(feed),
+            {
+                "content": text,
+                "fetched_at": fetched_at.isoformat(),
+                "etag": feed.etag,
+                "last_modified": feed.last_modified,
+            },
+            ttl=CacheTTL.CALENDAR_FEED,
+        )
 
-        for feed in self.feeds.values():
-            if feed.url == identifier or feed.name == identifier:
-                return feed
+    def _conditional_headers(self, feed: CalendarFeed) -> Dict[str, str]:
+        """Request headers that let the server answer 304 for an unchanged feed"""
+        headers = {}
+        # Only worth asking when there is a calendar to keep
+        if feed.calendar is not None:
+            if feed.etag:
+                headers["If-None-Match"] = feed.etag
+            if feed.last_modified:
+                headers["If-Modified-Since"] = feed.last_modified
+        return headers
+
+    def _read_feed_body(self, response: requests.Response) -> bytes:
+        """Download a feed's body, refusing it once it exceeds max_feed_bytes
+
+        A declared Content-Length over the limit is refused before reading,
+        a chunked or undeclared body as soon as it passes the limit.
+        """
+        length = response.headers.get("Content-Length")
+        if length and str(length).isdigit() and int(length) > self.max_feed_bytes:
+            raise ValueError(
+                f"Feed is {int(length)} bytes, above the limit of "
+                f"{self.max_feed_bytes} bytes (MAX_FEED_SIZE_MB)"
+            )
 
-        return None
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(chunk_size=FEED_CHUNK_BYTES):
+            received += len(chunk)
+            if received > self.max_feed_bytes:
+                raise ValueError(
+                    f"Feed is at least {received} bytes, above the limit of "
+                    f"{self.max_feed_bytes} bytes (MAX_FEED_SIZE_MB)"
+                )
+            chunks.append(chunk)
+        return b"".join(chunks)
 
-    def _refresh_single_calendar(self, feed: CalendarFeed) -> Dict[str, Any]:
-        """Refresh a single calendar"""
+    def _mark_not_modified(self, feed: CalendarFeed) -> Dict[str, Any]:
+        """Keep the current calendar after a 304 response"""
+        logger.info(f"Calendar '{feed.name}' not modified")
         with self._lock:
-            try:
+            feed.last_fetch = datetime.now(UTC)
+            feed.error = None
+            event_count = feed.event_count
+            calendar_name = feed.display_name or feed.name
+
+        # Keep the persisted body alive, it is still current
+        if self.cache is not None:
+            self.cache.expire(self._feed_cache_key(feed), CacheTTL.CALENDAR_FEED)
+
+        return {
+            "status": "not_modified",
+            "feed_url": feed.url,
+            "feed_name": feed.name,
+            "feed_id": feed.id,
+            "last_fetch": feed.last_fetch_iso,
+            "event_count": event_count,
+            "calendar_name": calendar_name,
+        }
+
+    def _refresh_single_calendar(
+        self, feed: CalendarFeed, use_cached: bool = False
+    ) -> Dict[str, Any]:
+        """Refresh a single calendar
+
+        The feed is fetched and parsed without holding the lock, which is only
+        taken to swap in the new calendar, so queries never wait on the network.
+        Its events are converted for queries lazily, on first access.
+        With use_cached, a body persisted in the cache is used instead of
+        downloading the feed again. Downloads are conditional on the last
+        ETag/Last-Modified, so an unchanged feed is neither sent nor re-parsed,
+        and a body identical to the last one parsed is not parsed again.
+        """
+        try:
+            cached = self._load_cached_feed(feed) if use_cached else None
+            if cached:
+                logger.info(f"Loading calendar '{feed.name}' from cache")
+                content = cached["content"]
+                fetched_at = datetime.fromisoformat(cached["fetched_at"])
+                etag = cached.get("etag")
+                last_modified = cached.get("last_modified")
+            else:
                 logger.info(f"Fetching calendar '{feed.name}' from: {feed.url}")
-                response = requests.get(
-                    feed.url, timeout=90
-                )  # Increased timeout for slow feeds
-                response.raise_for_status()
-
-                calendar = Calendar.from_ical(response.content)
-                feed.calendar = calendar
-                feed.last_fetch = datetime.now(UTC)
+                # Streamed so the body is read within max_feed_bytes, the
+                # connection is released on every path out of the block
+                with requests.get(
+                    feed.url,
+                    headers=self._conditional_headers(feed),
+                    timeout=90,  # Increased timeout for slow feeds
+                    stream=True,
+                ) as response:
+                    if response.status_code == 304:
+                        return self._mark_not_modified(feed)
+
+                    response.raise_for_status()
+                    content = self._read_feed_body(response)
+                    fetched_at = datetime.now(UTC)
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+
+            # Servers without validators resend unchanged bodies in full,
+            # those keep the calendar already parsed from them
+            digest = _body_digest(content)
+            unchanged = digest == feed.body_digest and feed.calendar is not None
+
+            # Events are converted on first query (see _feed_events), so a
+            # feed that is refreshed but never queried is only counted
+            calendar = None if unchanged else Calendar.from_ical(content)
+
+            with self._lock:
+                if not unchanged:
+                    feed.calendar = calendar
+                    feed.body_digest = digest
+                feed.last_fetch = fetched_at
                 feed.error = None
+                # Only trust the validators once their body parsed
+                feed.etag = etag
+                feed.last_modified = last_modified
+                event_count = feed.event_count
+                calendar_name = feed.display_name or feed.name
 
-                event_count = sum(
-                    1 for comp in calendar.walk() if comp.name == "VEVENT"
-                )
+            if not cached:
+                self._store_cached_feed(feed, content, fetched_at)
 
-                return {
-                    "status": "success",
-                    "feed_url": feed.url,
-                    "feed_name": feed.name,
-                    "feed_id": feed.id,
-                    "last_fetch": feed.last_fetch.isoformat(),
-                    "event_count": event_count,
-                    "calendar_name": str(calendar.get("X-WR-CALNAME", feed.name)),
-                }
-            except requests.exceptions.Timeout:
+            return {
+                "status": "success",
+                "feed_url": feed.url,
+                "feed_name": feed.name,
+                "feed_id": feed.id,
+                "last_fetch": feed.last_fetch_iso,
+                "event_count": event_count,
+                "calendar_name": calendar_name,
+            }
+        except requests.exceptions.Timeout:
+            error_msg = (
+                f"Calendar feed '{feed.name}' timed out after 30 seconds.\n"
+                "Possible issues:\n"
+                "  • The calendar server is slow or unresponsive\n"
+                "  • Network connectivity issues\n"
+                "  • The URL might be incorrect\n"
+                "To fix:\n"
+                "  • Try refreshing again with `refresh_calendars`\n"
+                "  • Verify the calendar URL is accessible\n"
+                "  • Check if the calendar provider is online"
+            )
+            logger.error(f"Timeout fetching feed '{feed.name}'")
+            feed.error = "Connection timeout"
+            return {
+                "status": "error",
+                "feed_url": feed.url,
+                "feed_name": feed.name,
+                "feed_id": feed.id,
+                "error": error_msg,
+                "last_fetch": feed.last_fetch_iso,
+            }
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 401:
                 error_msg = (
-                    f"Calendar feed '{feed.name}' timed out after 30 seconds.\n"
-                    "Possible issues:\n"
-                    "  • The calendar server is slow or unresponsive\n"
-                    "  • Network connectivity issues\n"
-                    "  • The URL might be incorrect\n"
+                    f"Authentication failed for calendar '{feed.name}'.\n"
+                    "The calendar requires authentication.\n"
                     "To fix:\n"
-                    "  • Try refreshing again with `refresh_calendars`\n"
-                    "  • Verify the calendar URL is accessible\n"
-                    "  • Check if the calendar provider is online"
+                    "  • Check if the calendar URL includes authentication tokens\n"
+                    "  • Regenerate the calendar's secret URL\n"
+                    "  • Make sure the calendar is set to public or has proper access"
                 )
-                logger.error(f"Timeout fetching feed '{feed.name}'")
-                feed.error = "Connection timeout"
-                return {
-                    "status": "error",
-                    "feed_url": feed.url,
-                    "feed_name": feed.name,
-                    "feed_id": feed.id,
-                    "error": error_msg,
-                    "last_fetch": (
-                        feed.last_fetch.isoformat() if feed.last_fetch else None
-                    ),
-                }
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 401:
-                    error_msg = (
-                        f"Authentication failed for calendar '{feed.name}'.\n"
-                        "The calendar requires authentication.\n"
-                        "To fix:\n"
-                        "  • Check if the calendar URL includes authentication tokens\n"
-                        "  • Regenerate the calendar's secret URL\n"
-                        "  • Make sure the calendar is set to public or has proper access"
-                    )
-                elif e.response.status_code == 404:
-                    error_msg = (
-                        f"Calendar feed '{feed.name}' not found (404).\n"
-                        "The calendar URL is invalid or has been removed.\n"
-                        "To fix:\n"
-                        "  • Verify the calendar URL is correct\n"
-                        "  • Get a new sharing URL from your calendar provider\n"
-                        "  • Update ICAL_FEED_CONFIGS environment variable with correct URL\n"
-                        "  • Restart the server after updating configuration"
-                    )
-                else:
-                    error_msg = f"HTTP error {e.response.status_code} for calendar '{feed.name}': {str(e)}"
-
-                logger.error(f"HTTP error fetching feed '{feed.name}': {e}")
-                feed.error = str(e)
-                return {
-                    "status": "error",
-                    "feed_url": feed.url,
-                    "feed_name": feed.name,
-                    "feed_id": feed.id,
-                    "error": error_msg,
-                    "last_fetch": (
-                        feed.last_fetch.isoformat() if feed.last_fetch else None
-                    ),
-                }
-            except Exception as e:
+            elif e.response.status_code == 404:
                 error_msg = (
-                    f"Failed to fetch calendar '{feed.name}': {str(e)}\n"
-                    "To diagnose:\n"
-                    "  • Use `list_calendar_feeds` to check feed status\n"
-                    "  • Try removing and re-adding the feed\n"
-                    "  • Verify the calendar URL format is correct"
+                    f"Calendar feed '{feed.name}' not found (404).\n"
+                    "The calendar URL is invalid or has been removed.\n"
+                    "To fix:\n"
+                    "  • Verify the calendar URL is correct\n"
+                    "  • Get a new sharing URL from your calendar provider\n"
+                    "  • Update ICAL_FEED_CONFIGS environment variable with correct URL\n"
+                    "  • Restart the server after updating configuration"
                 )
-                logger.error(
-                    f"Failed to fetch calendar '{feed.name}' from {feed.url}: {e}"
+            else:
+                error_msg = f"HTTP error {e.response.status_code} for calendar '{feed.name}': {str(e)}"
+
+            logger.error(f"HTTP error fetching feed '{feed.name}': {e}")
+            feed.error = str(e)
+            return {
+                "status": "error",
+                "feed_url": feed.url,
+                "feed_name": feed.name,
+                "feed_id": feed.id,
+                "error": error_msg,
+                "last_fetch": feed.last_fetch_iso,
+            }
+        except Exception as e:
+            error_msg = (
+                f"Failed to fetch calendar '{feed.name}': {str(e)}\n"
+                "To diagnose:\n"
+                "  • Use `list_calendar_feeds` to check feed status\n"
+                "  • Try removing and re-adding the feed\n"
+                "  • Verify the calendar URL format is correct"
+            )
+            logger.error(f"Failed to fetch calendar '{feed.name}' from {feed.url}: {e}")
+            feed.error = str(e)
+            return {
+                "status": "error",
+                "feed_url": feed.url,
+                "feed_name": feed.name,
+                "feed_id": feed.id,
+                "error": error_msg,
+                "last_fetch": feed.last_fetch_iso,
+            }
+
+    def _parse_events(self, calendar: Calendar, feed: CalendarFeed) -> FeedEvents:
+        """Convert every VEVENT of a calendar once, for reuse across queries"""
+        events = []
+        search_texts = []
+        for component in calendar.walk("VEVENT"):
+            event_dict = self._event_to_dict(component, feed)
+            event_start = component.get("DTSTART")
+            start = (
+                self._normalize_datetime(event_start.dt)
+                if event_start and hasattr(event_start, "dt")
+                else None
+            )
+            end = self._approximate_end(component, start) if start else None
+            # Lowercased summary, description and location, separated so a
+            # query cannot match across two fields
+            search_texts.append(
+                "\0".join(
+                    (event_dict[field] or "").lower()
+                    for field in ("summary", "description", "location")
                 )
-                feed.error = str(e)
-                return {
-                    "status": "error",
-                    "feed_url": feed.url,
-                    "feed_name": feed.name,
-                    "feed_id": feed.id,
-                    "error": error_msg,
-                    "last_fetch": (
-                        feed.last_fetch.isoformat() if feed.last_fetch else None
-                    ),
-                }
+            )
+            events.append(
+                ParsedEvent(
+                    component,
+                    event_dict,
+                    start,
+                    end,
+                    self._start_sort_key(component),
+                )
+            )
+        return FeedEvents(calendar, events, search_texts)
+
+    def _approximate_end(self, component: Event, start: datetime) -> Optional[datetime]:
+        """UTC end of a single event's span, never before its start"""
+        event_end = component.get("DTEND")
+        duration = component.get("DURATION")
+        if event_end and hasattr(event_end, "dt"):
+            end = self._normalize_datetime(event_end.dt)
+        elif duration and hasattr(duration, "dt"):
+            end = start + duration.dt
+        else:
+            # No DTEND or DURATION: a deliberately generous upper bound. Date
+            # events last a day and datetime events are instants, so a day
+            # covers both when picking candidates for expansion
+            end = start + timedelta(days=1)
+        return max(end, start) if end else None
+
+    def _feed_events(self, feed: CalendarFeed) -> Optional[FeedEvents]:
+        """Get the parsed events of a feed's current calendar, parsing them on first use
+
+        Queries read without locking: a refresh publishes a new calendar by
+        replacing the attribute, and a parsed view never changes once built,
+        so each query works on one consistent snapshot. The lock only makes
+        concurrent first uses build the view once. Returns None while the
+        feed has no calendar.
+        """
+        parsed, calendar = feed.parsed, feed.calendar
+        if parsed is not None and parsed.calendar is calendar:
+            return parsed
+        if calendar is None:
+            return None
+
+        with self._lock:
+            parsed, calendar = feed.parsed, feed.calendar
+            if parsed is None or parsed.calendar is not calendar:
+                parsed = self._parse_events(calendar, feed)
+                feed.parsed = parsed
+        return parsed
+
+    def _start_sort_key(self, component: Event) -> Tuple[float, int]:
+        """Numeric sort key for an event's start
+
+        Orders like the serialized UTC start strings did: events without a
+        start first, and an all-day event before timed events of its day.
+        """
+        event_start = component.get("DTSTART")
+        dt = getattr(event_start, "dt", None)
+        if isinstance(dt, datetime):
+            return (self._to_utc(dt).timestamp(), 1)
+        if isinstance(dt, date):
+            return (datetime(dt.year, dt.month, dt.day, tzinfo=UTC).timestamp(), 0)
+        return (float("-inf"), 0)
 
     def _event_to_dict(self, event: Event, feed: CalendarFeed) -> Dict[str, Any]:
         """Convert an iCalendar event to a dictionary with feed information"""
@@ -324,11 +1259,7 @@ class MultiCalendarService:
                 dt = value.dt
                 if isinstance(dt, datetime):
                     # Normalize to UTC before serializing
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=UTC)
-                    else:
-                        dt = dt.astimezone(UTC)
-                    return dt.isoformat()
+                    return self._to_utc(dt).isoformat()
                 else:
                     return dt.isoformat() if hasattr(dt, "isoformat") else str(dt)
             return str(value)
@@ -346,10 +1277,7 @@ class MultiCalendarService:
                     if hasattr(duration, "dt"):
                         # Normalize start time to UTC first
                         if isinstance(start_dt, datetime):
-                            if start_dt.tzinfo is None:
-                                start_dt = start_dt.replace(tzinfo=UTC)
-                            else:
-                                start_dt = start_dt.astimezone(UTC)
+                            start_dt = self._to_utc(start_dt)
 
                         # duration.dt is a timedelta
                         end_dt = start_dt + duration.dt
@@ -368,16 +1296,8 @@ class MultiCalendarService:
                 if hasattr(dtstart, "dt"):
                     start_dt = dtstart.dt
                     if isinstance(start_dt, datetime):
-                        # Normalize start time to UTC first
-                        if start_dt.tzinfo is None:
-                            start_dt = start_dt.replace(tzinfo=UTC)
-                        else:
-                            start_dt = start_dt.astimezone(UTC)
-
                         # For datetime events, add 1 hour
-                        from datetime import timedelta
-
-                        dtend = start_dt + timedelta(hours=1)
+                        dtend = self._to_utc(start_dt) + timedelta(hours=1)
                     else:
                         # For date-only (all-day) events, end is same as start
                         dtend = start_dt
@@ -429,28 +1349,30 @@ class MultiCalendarService:
 
         return event_dict
 
+    def _to_utc(self, dt: datetime) -> datetime:
+        """Convert a datetime to UTC, treating naive datetimes as UTC"""
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=UTC)
+        if dt.tzinfo is UTC:
+            return dt
+        return dt.astimezone(UTC)
+
     def _normalize_datetime(self, dt) -> Optional[datetime]:
         """Normalize various date/datetime formats to UTC datetime"""
         if dt is None:
             return None
 
         if isinstance(dt, datetime):
-            if dt.tzinfo is None:
-                # Naive datetime - assume UTC for consistency
-                return dt.replace(tzinfo=UTC)
-            else:
-                # Timezone-aware datetime - convert to UTC
-                return dt.astimezone(UTC)
+            return self._to_utc(dt)
 
         if isinstance(dt, str):
             try:
-                parsed = date_parser.parse(dt)
-                if parsed.tzinfo is None:
-                    # Naive datetime from string - assume UTC
-                    return parsed.replace(tzinfo=UTC)
-                else:
-                    # Timezone-aware datetime from string - convert to UTC
-                    return parsed.astimezone(UTC)
+                # ISO 8601 is the common case and much cheaper than dateutil
+                return self._to_utc(datetime.fromisoformat(dt))
+            except ValueError:
+                pass
+            try:
+                return self._to_utc(date_parser.parse(dt))
             except (ValueError, TypeError, OverflowError) as exc:
                 logger.debug("Failed to parse datetime string %r: %s", dt, exc)
                 return None
@@ -482,12 +1404,7 @@ class MultiCalendarService:
         Returns:
             List of event dictionaries
         """
-        events = []
-
-        # Validate feed identifiers if provided
-        if feed_identifiers:
-            for identifier in feed_identifiers:
-                self._validate_feed_exists(identifier)
+        feeds_to_query = self._feeds_to_query(feed_identifiers)
 
         # Parse date filters - use timezone-aware datetimes for recurring_ical_events
         if start_date:
@@ -500,54 +1417,44 @@ class MultiCalendarService:
         else:
             end_dt = start_dt + timedelta(days=7)
 
-        # Determine which feeds to query
-        feeds_to_query = []
-        if feed_identifiers:
-            for identifier in feed_identifiers:
-                feed = self._find_feed(identifier)
-                if feed:
-                    feeds_to_query.append(feed)
-        else:
-            feeds_to_query = list(self.feeds.values())
+        return self._get_events_impl(start_dt, end_dt, feeds_to_query, limit, offset)
 
-        with self._lock:
-            for feed in feeds_to_query:
-                if not feed.calendar:
-                    continue
-
-                try:
-                    # Use recurring_ical_events to expand recurring events
-                    # This will give us individual occurrences instead of just the RRULE
-                    expanded_events = recurring_ical_events.of(feed.calendar).between(
-                        start_dt, end_dt
-                    )
+    def _feeds_to_query(
+        self, feed_identifiers: Optional[List[str]]
+    ) -> List[CalendarFeed]:
+        """Feeds for the given identifiers, validating each, or all feeds"""
+        if feed_identifiers:
+            return [
+                self._validate_feed_exists(identifier)
+                for identifier in feed_identifiers
+            ]
+        return list(self.feeds.values())
 
-                    for event in expanded_events:
-                        event_dict = self._event_to_dict(event, feed)
-                        events.append(event_dict)
+    def _get_events_impl(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        feeds_to_query: List[CalendarFeed],
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Events of the given feeds between two UTC datetimes, sorted by start"""
+        # Expansion is pure Python and holds the GIL, so feeds are expanded
+        # one after the other rather than on a thread pool
+        feed_events = [
+            self._expand_feed(feed, start_dt, end_dt) for feed in feeds_to_query
+        ]
 
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to expand recurring events for feed {feed.name}: {e}"
-                    )
-                    # Fallback to non-recurring event processing
-                    for component in feed.calendar.walk():
-                        if component.name == "VEVENT":
-                            event_start = component.get("DTSTART")
-                            if event_start and hasattr(event_start, "dt"):
-                                event_dt = self._normalize_datetime(event_start.dt)
-
-                                # Apply date filters
-                                if start_dt and event_dt and event_dt < start_dt:
-                                    continue
-                                if end_dt and event_dt and event_dt > end_dt:
-                                    continue
-
-                            event_dict = self._event_to_dict(component, feed)
-                            events.append(event_dict)
+        # Entries are (start key, feed position, calendar position, event), so
+        # equal starts keep the order expansion would return them in
+        events = [
+            (sort_key, feed_number, index, event_dict)
+            for feed_number, entries in enumerate(feed_events)
+            for sort_key, index, event_dict in entries
+        ]
 
         # Sort by start date
-        events.sort(key=lambda x: x.get("start") or "")
+        events.sort(key=itemgetter(0, 1, 2))
 
         # Apply pagination
         if limit is not None:
@@ -556,19 +1463,92 @@ class MultiCalendarService:
         elif offset > 0:
             events = events[offset:]
 
+        return [entry[-1] for entry in events]
+
+    def _expand_feed(
+        self, feed: CalendarFeed, start_dt: datetime, end_dt: datetime
+    ) -> List[Tuple[Tuple[float, int], int, Dict[str, Any]]]:
+        """One feed's events between two UTC datetimes
+
+        Returns (start key, calendar position, event) entries, unsorted.
+        """
+        events = []
+        parsed = self._feed_events(feed)
+        if parsed is None:
+            return events
+
+        try:
+            # Only expand the series and the single events near the range
+            # that cannot be checked directly, so rrule iteration skips
+            # everything else
+            candidates = parsed.expansion_candidates(start_dt, end_dt)
+            if candidates:
+                # Use recurring_ical_events to expand recurring events
+                # This will give us individual occurrences instead of just the RRULE
+                expanded_events = recurring_ical_events.of(
+                    self._expansion_calendar(parsed.calendar, candidates)
+                ).between(start_dt, end_dt)
+
+                for event in expanded_events:
+                    event_dict = self._event_to_dict(event, feed)
+                    events.append(
+                        (
+                            self._start_sort_key(event),
+                            parsed.uid_order.get(event_dict["uid"] or "", 0),
+                            event_dict,
+                        )
+                    )
+
+            # Expansion would return these unchanged apart from DTEND
+            for index, parsed_event, event_end in parsed.single_occurrences(
+                start_dt, end_dt
+            ):
+                event_dict = dict(parsed_event.event, end=event_end.isoformat())
+                events.append((parsed_event.sort_key, index, event_dict))
+
+        except Exception as e:
+            logger.warning(
+                f"Failed to expand recurring events for feed {feed.name}: {e}"
+            )
+            # Fallback to non-recurring event processing
+            for index, component in enumerate(parsed.calendar.walk("VEVENT")):
+                event_start = component.get("DTSTART")
+                if event_start and hasattr(event_start, "dt"):
+                    event_dt = self._normalize_datetime(event_start.dt)
+
+                    # Apply date filters
+                    if start_dt and event_dt and event_dt < start_dt:
+                        continue
+                    if end_dt and event_dt and event_dt > end_dt:
+                        continue
+
+                event_dict = self._event_to_dict(component, feed)
+                events.append((self._start_sort_key(component), index, event_dict))
+
         return events
 
+    def _expansion_calendar(self, calendar: Calendar, events: List[Event]) -> Calendar:
+        """Copy of a calendar's properties and timezones holding only the given events"""
+        subset = Calendar(calendar)
+        for component in calendar.subcomponents:
+            if component.name == "VTIMEZONE":
+                subset.add_component(component)
+        for event in events:
+            subset.add_component(event)
+        return subset
+
+    @cache_aside(
+        CacheConfig(ttl=CacheTTL.CALENDAR_EVENTS_TODAY), key_func=_today_events_key
+    )
     def get_today_events(
         self, feed_identifiers: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Get events for today from specified feeds or all feeds"""
-        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        today = _utc_midnight()
         tomorrow = today + timedelta(days=1)
 
-        return self.get_events(
-            start_date=today.isoformat(),
-            end_date=tomorrow.isoformat(),
-            feed_identifiers=feed_identifiers,
+        return self._get_events_impl(
+            today, tomorrow, self._feeds_to_query(feed_identifiers)
         )
 
     def get_upcoming_events(
@@ -576,7 +1556,7 @@ class MultiCalendarService:
     ) -> List[Dict[str, Any]]:
         """Get upcoming events from specified feeds or all feeds"""
         now = datetime.now(UTC)
-        future_events = []
+        per_feed = []
 
         feeds_to_query = []
         if feed_identifiers:
@@ -587,23 +1567,20 @@ class MultiCalendarService:
         else:
             feeds_to_query = list(self.feeds.values())
 
-        with self._lock:
-            for feed in feeds_to_query:
-                if not feed.calendar:
-                    continue
-
-                for component in feed.calendar.walk():
-                    if component.name == "VEVENT":
-                        event_start = component.get("DTSTART")
-                        if event_start and hasattr(event_start, "dt"):
-                            event_dt = self._normalize_datetime(event_start.dt)
-                            if event_dt and event_dt >= now:
-                                event_dict = self._event_to_dict(component, feed)
-                                future_events.append((event_dt, event_dict))
-
-        # Sort by start date and return requested count
-        future_events.sort(key=lambda x: x[0])
-        return [event for _, event in future_events[:count]]
+        for feed in feeds_to_query:
+            parsed = self._feed_events(feed)
+            if parsed is None:
+                continue
+
+            # Events are pre-sorted by start: jump to the first future one
+            # and take at most `count` from this feed
+            index = bisect_left(parsed.starts, now)
+            per_feed.append(parsed.by_start[index : index + count])
+
+        # Merge the sorted runs and stop after the requested count, ties
+        # keep feed order as a stable sort would
+        earliest = heapq.merge(*per_feed, key=attrgetter("start"))
+        return [dict(parsed.event) for parsed in islice(earliest, count)]
 
     @cache_aside(CacheConfig(ttl=CacheTTL.CALENDAR_EVENTS, key_prefix="ical:search"))
     def search_events(
@@ -613,14 +1590,9 @@ class MultiCalendarService:
         if not query:
             return []
 
-        query_lower = query.lower()
-        # Also handle common variations
-        query_variations = [
-            query_lower,
-            query_lower.replace(" ", "_"),  # Handle underscore vs space
-            query_lower.replace("_", " "),  # Handle space vs underscore
-            query_lower.replace("-", " "),  # Handle hyphen vs space
-        ]
+        # Also handle common variations, with one regex pass per event
+        # instead of a substring check per variation
+        query_variations, pattern = _search_terms(query.lower())
 
         matching_events = []
 
@@ -628,9 +1600,8 @@ class MultiCalendarService:
         if not feed_identifiers:
             # Check if query matches any feed name
             for feed in self.feeds.values():
-                feed_name_lower = feed.name.lower()
                 if any(
-                    var in feed_name_lower or feed_name_lower in var
+                    var in feed.name_lower or feed.name_lower in var
                     for var in query_variations
                 ):
                     # Query matches a feed name, search only in that feed
@@ -647,35 +1618,19 @@ class MultiCalendarService:
         else:
             feeds_to_query = list(self.feeds.values())
 
-        with self._lock:
-            for feed in feeds_to_query:
-                if not feed.calendar:
-                    continue
-
-                # Also check if query matches feed name (for cross-feed search)
-                feed_name_matches = any(
-                    var in feed.name.lower() for var in query_variations
-                )
-
-                for component in feed.calendar.walk():
-                    if component.name == "VEVENT":
-                        summary = str(component.get("SUMMARY", "")).lower()
-                        description = str(component.get("DESCRIPTION", "")).lower()
-                        location = str(component.get("LOCATION", "")).lower()
-
-                        # Check if any variation matches
-                        matches = any(
-                            var in summary or var in description or var in location
-                            for var in query_variations
-                        )
+        for feed in feeds_to_query:
+            feed_events = self._feed_events(feed)
+            if feed_events is None:
+                continue
 
-                        # Include all events from matching feed names or matching event content
-                        if matches or feed_name_matches:
-                            event_dict = self._event_to_dict(component, feed)
-                            matching_events.append(event_dict)
+            # Include all events from matching feed names or matching event content
+            if pattern.search(feed.name_lower):
+                matching_events.extend(feed_events.events)
+            else:
+                matching_events.extend(feed_events.search(pattern))
 
-        matching_events.sort(key=lambda x: x.get("start") or "")
-        return matching_events
+        matching_events.sort(key=attrgetter("sort_key"))
+        return [dict(parsed.event) for parsed in matching_events]
 
     def get_event_by_uid(
         self, uid: str, feed_identifier: Optional[str] = None
@@ -689,74 +1644,71 @@ class MultiCalendarService:
         else:
             feeds_to_query = list(self.feeds.values())
 
-        with self._lock:
-            for feed in feeds_to_query:
-                if not feed.calendar:
-                    continue
+        for feed in feeds_to_query:
+            feed_events = self._feed_events(feed)
+            if feed_events is None:
+                continue
 
-                for component in feed.calendar.walk():
-                    if component.name == "VEVENT":
-                        if str(component.get("UID", "")) == uid:
-                            return self._event_to_dict(component, feed)
+            parsed = feed_events.by_uid.get(uid)
+            if parsed is not None:
+                return dict(parsed.event)
 
         return None
 
-    @cache_aside(CacheConfig(ttl=CacheTTL.CALENDAR_INFO, key_prefix="ical:info"))
+    # Feed metadata changes rarely: keep it cached and refresh it before expiry
+    @cache_aside(
+        CacheConfig(
+            ttl=CacheTTL.CALENDAR_INFO, key_prefix="ical:info", refresh_ahead=0.2
+        )
+    )
     def get_calendar_info(self) -> Dict[str, Any]:
         """Get information about all cached calendars"""
         info = {"status": "loaded", "total_feeds": len(self.feeds), "feeds": []}
 
-        with self._lock:
-            for feed_id, feed in self.feeds.items():
-                if feed.calendar:
-                    event_count = sum(
-                        1 for comp in feed.calendar.walk() if comp.name == "VEVENT"
-                    )
+        for feed_id, feed in self.feeds.items():
+            # One snapshot per feed, a refresh may publish a new calendar
+            calendar = feed.calendar
+            if calendar:
+                event_count = feed.event_count
 
-                    # Try to get the calendar name from the actual calendar data
-                    cal_display_name = None
-                    if hasattr(feed.calendar, "get"):
-                        cal_display_name = feed.calendar.get("X-WR-CALNAME")
-                        if not cal_display_name:
-                            cal_display_name = feed.calendar.get("NAME")
-
-                    feed_info = {
-                        "feed_id": feed.id,
-                        "feed_name": feed.name,
-                        "calendar_name": (
-                            str(cal_display_name) if cal_display_name else feed.name
-                        ),
-                        "description": (
-                            str(feed.calendar.get("X-WR-CALDESC", ""))
-                            if hasattr(feed.calendar, "get")
-                            else ""
-                        ),
-                        "timezone": (
-                            str(feed.calendar.get("X-WR-TIMEZONE", "UTC"))
-                            if hasattr(feed.calendar, "get")
-                            else "UTC"
-                        ),
-                        "feed_url": feed.url,
-                        "event_count": event_count,
-                        "last_fetch": (
-                            feed.last_fetch.isoformat() if feed.last_fetch else None
-                        ),
-                        "status": "loaded",
-                        "error": feed.error,
-                    }
-                else:
-                    feed_info = {
-                        "feed_url": feed.url,
-                        "feed_name": feed.name,
-                        "feed_id": feed.id,
-                        "status": "not_loaded" if not feed.error else "error",
-                        "error": feed.error,
-                        "last_fetch": (
-                            feed.last_fetch.isoformat() if feed.last_fetch else None
-                        ),
-                    }
-
-                info["feeds"].append(feed_info)
+                # Try to get the calendar name from the actual calendar data
+                cal_display_name = feed.display_name
+                if not cal_display_name and hasattr(calendar, "get"):
+                    cal_display_name = calendar.get("NAME")
+
+                feed_info = {
+                    "feed_id": feed.id,
+                    "feed_name": feed.name,
+                    "calendar_name": (
+                        str(cal_display_name) if cal_display_name else feed.name
+                    ),
+                    "description": (
+                        str(calendar.get("X-WR-CALDESC", ""))
+                        if hasattr(calendar, "get")
+                        else ""
+                    ),
+                    "timezone": (
+                        str(calendar.get("X-WR-TIMEZONE", "UTC"))
+                        if hasattr(calendar, "get")
+                        else "UTC"
+                    ),
+                    "feed_url": feed.url,
+                    "event_count": event_count,
+                    "last_fetch": feed.last_fetch_iso,
+                    "status": "loaded",
+                    "error": feed.error,
+                }
+            else:
+                feed_info = {
+                    "feed_url": feed.url,
+                    "feed_name": feed.name,
+                    "feed_id": feed.id,
+                    "status": "not_loaded" if not feed.error else "error",
+                    "error": feed.error,
+                    "last_fetch": feed.last_fetch_iso,
+                }
+
+            info["feeds"].append(feed_info)
 
         info["refresh_interval_minutes"] = self.refresh_interval // 60
 
@@ -778,15 +1730,31 @@ class MultiCalendarService:
             }
 
             # Add calendar display name if available
-            if feed.calendar and hasattr(feed.calendar, "get"):
-                cal_display_name = feed.calendar.get("X-WR-CALNAME")
-                if cal_display_name:
-                    feed_entry["calendar_name"] = str(cal_display_name)
+            if feed.calendar and feed.display_name:
+                feed_entry["calendar_name"] = feed.display_name
 
             feeds_list.append(feed_entry)
 
         return feeds_list
 
+    def _feeds_version(self) -> Tuple[Tuple[str, int], ...]:
+        """Identifies the configured feeds and their published calendars"""
+        return tuple((feed_id, feed.version) for feed_id, feed in self.feeds.items())
+
+    def _feeds_etag(self) -> str:
+        """Fingerprint of the configured feeds' contents
+
+        Built from the body digests, so every process serving the same feed
+        bodies agrees on it. A calendar not parsed from a body falls back to
+        its process-local version.
+        """
+        fingerprint = hashlib.blake2b(digest_size=16)
+        for feed_id, feed in self.feeds.items():
+            fingerprint.update(feed_id.encode())
+            fingerprint.update(feed.body_digest or f"v{feed.version}".encode())
+            fingerprint.update(b"\0")
+        return fingerprint.hexdigest()
+
     def stop(self):
         """Stop the automatic refresh timer"""
         if self._refresh_timer:
@@ -808,20 +1776,7 @@ class MultiCalendarService:
 
         self.mcp.tool(
             name="refresh_calendar_feeds",
-            description="""Force refresh all calendar feeds to get the latest events.
-
-## Parameters
-None required
-
-## Returns
-• Success status
-• Number of feeds refreshed
-• Total events found
-
-## Use Cases
-• Get immediate updates from all calendar sources
-• Sync after adding new feeds
-• Refresh before important queries""",
+            description=_TOOL_DESCRIPTIONS["refresh_calendar_feeds"],
             title="Refresh Calendar Feeds",
             annotations={"title": "Refresh Calendar Feeds"},
         )(self.refresh_feeds_for_mcp)
@@ -836,175 +1791,50 @@ None required
         # Register tools (Claude cannot use resources, only tools)
         self.mcp.tool(
             name="get_calendar_info",
-            description=f"""Get information about all configured calendar feeds (cached for {CacheTTL.CALENDAR_INFO//60} minutes).
-
-## Returns
-• Status of each feed
-• Event counts per feed
-• Last update times
-• Total number of feeds
-• Refresh interval settings
-
-## Use Cases
-• Check feed health and status
-• See when feeds were last updated
-• Monitor feed event counts
-
-## Caching
-• Feed information cached for {CacheTTL.CALENDAR_INFO//60} minutes
-• Feed metadata doesn't change frequently""",
+            description=_TOOL_DESCRIPTIONS["get_calendar_info"],
             title="Calendar Information",
             annotations={"title": "Calendar Information"},
         )(self.get_calendar_info_resource)
 
         self.mcp.tool(
             name="get_today_events",
-            description=f"""Get all calendar events happening today across all configured feeds (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Returns
-• List of today's events
-• Event times and durations
-• Event locations and descriptions
-• Feed source for each event
-
-## Use Cases
-• Daily schedule overview
-• Check for conflicts today
-• Plan the current day
-
-## Related Tools
-• Use `get_tomorrow_events` for next day planning
-• Use `get_calendar_conflicts` to find overlapping events
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Balances freshness with performance for calendar data""",
+            description=_TOOL_DESCRIPTIONS["get_today_events"],
             title="Today's Events",
             annotations={"title": "Today's Events"},
         )(self.get_today_events_resource)
 
-        self.mcp.tool(
-            name="get_upcoming_events",
-            description=f"""Get the next 20 upcoming calendar events across all configured feeds (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Returns
-• Next 20 events sorted by start time
-• Event details (title, time, location)
-• Feed source for each event
-
-## Use Cases
-• Preview upcoming schedule
-• Long-term planning
-• Check future availability
-
-## Related Tools
-• Use `get_week_events` for current week only
-• Use `get_month_events` for current month view
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Recent events refreshed periodically""",
-            title="Upcoming Events",
-            annotations={"title": "Upcoming Events"},
-        )(self.get_upcoming_events_resource)
-
-        # Parameterized queries as tools (Claude can only get static resources)
-        self.mcp.tool(
-            name="get_events_on_date",
-            description=f"""Get all calendar events on a specific date (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Parameters
-• date: Date in YYYY-MM-DD format (required)
-• feed: Specific feed name to filter (optional)
-  - Call `get_calendar_feeds` to see available feed names
-
-## Returns
-All events for the specified date
-
-## Use Cases
-• Check schedule for a specific day
-• Plan for future dates
-• Review past events
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Date-specific queries use cached event data""",
+        self.mcp.tool(
+            name="get_upcoming_events",
+            description=_TOOL_DESCRIPTIONS["get_upcoming_events"],
+            title="Upcoming Events",
+            annotations={"title": "Upcoming Events"},
+        )(self.get_upcoming_events_resource)
+
+        # Parameterized queries as tools (Claude can only get static resources)
+        self.mcp.tool(
+            name="get_events_on_date",
+            description=_TOOL_DESCRIPTIONS["get_events_on_date"],
             title="Get Events on Date",
             annotations={"title": "Get Events on Date"},
         )(self.get_events_on_date_resource)
 
         self.mcp.tool(
             name="get_events_between_dates",
-            description=f"""Get all calendar events between two dates (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Parameters
-• start_date: Start date in YYYY-MM-DD format (required)
-• end_date: End date in YYYY-MM-DD format (required)
-• feed: Specific feed name to filter (optional)
-  - Call `get_calendar_feeds` to see available feed names
-
-## Returns
-All events between the specified dates
-
-## Use Cases
-• Get events for a custom date range
-• Plan vacations or trips
-• Review activity for a period
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Range queries use cached event data""",
+            description=_TOOL_DESCRIPTIONS["get_events_between_dates"],
             title="Get Events Between Dates",
             annotations={"title": "Get Events Between Dates"},
         )(self.get_events_between_resource)
 
         self.mcp.tool(
             name="get_events_after_date",
-            description=f"""Get all calendar events after a specific date (next 30 days) (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Parameters
-• date: Start date in YYYY-MM-DD format (required)
-• feed: Specific feed name to filter (optional)
-  - Call `get_calendar_feeds` to see available feed names
-
-## Returns
-Events for the next 30 days after the specified date
-
-## Use Cases
-• Look ahead from a specific date
-• Plan future activities
-• Check upcoming availability
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Future event queries use cached data""",
+            description=_TOOL_DESCRIPTIONS["get_events_after_date"],
             title="Get Events After Date",
             annotations={"title": "Get Events After Date"},
         )(self.get_events_after_resource)
 
         self.mcp.tool(
             name="search_calendar_events",
-            description=f"""Search for calendar events by text (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Parameters
-• query: Search text (required)
-• feed: Specific feed name to filter (optional)
-  - Call `get_calendar_feeds` to see available feed names
-
-## Returns
-Events matching the search query in:
-• Title
-• Description
-• Location
-
-## Use Cases
-• Find specific meetings or events
-• Search for events at a location
-• Locate events with specific keywords
-
-## Caching
-• Search results cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Searches performed on cached event data""",
+            description=_TOOL_DESCRIPTIONS["search_calendar_events"],
             title="Search Calendar Events",
             annotations={"title": "Search Calendar Events"},
         )(self.search_events_resource)
@@ -1012,17 +1842,7 @@ Events matching the search query in:
         # Tools for constant values (for LLM discovery)
         self.mcp.tool(
             name="get_calendar_feeds",
-            description="""Get list of configured calendar feed names and URLs.
-
-## Returns
-• Feed names
-• Feed URLs
-• Feed configuration details
-
-## Use Cases
-• See available feeds before filtering
-• Get feed names for other tool parameters
-• Check feed URLs for removal""",
+            description=_TOOL_DESCRIPTIONS["get_calendar_feeds"],
             title="Calendar Feeds",
             annotations={"title": "Calendar Feeds"},
         )(self.get_feeds_list_resource)
@@ -1030,143 +1850,35 @@ Events matching the search query in:
         # Additional tools for common queries
         self.mcp.tool(
             name="get_week_events",
-            description=f"""Get all calendar events for the current week (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Returns
-• All events from Monday to Sunday
-• Organized by day
-• Event times and details
-
-## Use Cases
-• Weekly planning
-• Week at a glance
-• Short-term scheduling
-
-## Related Tools
-• Use `get_today_events` for today only
-• Use `get_month_events` for broader view
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Week view uses cached event data""",
+            description=_TOOL_DESCRIPTIONS["get_week_events"],
             title="This Week's Events",
             annotations={"title": "This Week's Events"},
         )(self.get_week_events_resource)
 
         self.mcp.tool(
             name="get_month_events",
-            description=f"""Get all calendar events for the current month (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Returns
-• All events for the current month
-• Organized by date
-• Event counts per day
-
-## Use Cases
-• Monthly overview
-• Long-term planning
-• Month-end reviews
-
-## Related Tools
-• Use `get_week_events` for current week
-• Use `get_events_between_dates` for custom ranges
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Month view uses cached event data""",
+            description=_TOOL_DESCRIPTIONS["get_month_events"],
             title="This Month's Events",
             annotations={"title": "This Month's Events"},
         )(self.get_month_events_resource)
 
         self.mcp.tool(
             name="get_tomorrow_events",
-            description=f"""Get all calendar events for tomorrow (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Returns
-• Tomorrow's complete schedule
-• Event times and details
-• Feed sources
-
-## Use Cases
-• Next day preparation
-• Evening planning for tomorrow
-• Advance notifications
-
-## Related Tools
-• Use `get_today_events` for current day
-• Use `get_events_on_date` for other specific dates
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Tomorrow's events from cached data""",
+            description=_TOOL_DESCRIPTIONS["get_tomorrow_events"],
             title="Tomorrow's Events",
             annotations={"title": "Tomorrow's Events"},
         )(self.get_tomorrow_events_resource)
 
         self.mcp.tool(
             name="get_calendar_conflicts",
-            description=f"""Get overlapping or conflicting events in the next 7 days (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Returns
-• List of conflicting event pairs
-• Overlap duration
-• Conflict details
-
-## Use Cases
-• Identify scheduling conflicts
-• Find double-booked time slots
-• Clean up calendar overlaps
-
-## Related Tools
-• Use `get_week_events` to see all events
-• Use `get_today_events` to check today's conflicts
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Conflict detection on cached events""",
+            description=_TOOL_DESCRIPTIONS["get_calendar_conflicts"],
             title="Calendar Conflicts",
             annotations={"title": "Calendar Conflicts"},
         )(self.get_conflicts_resource)
 
         self.mcp.tool(
             name="analyze_calendar_conflicts",
-            description=f"""Analyze calendar conflicts with severity levels and advanced filtering (cached for {CacheTTL.CALENDAR_EVENTS//60} minutes).
-
-## Parameters
-• days_ahead: Number of days to analyze (default: "7")
-• include_all_day: Include all-day events - "true"/"false" (default: "false")
-• min_overlap_minutes: Minimum overlap to report (default: "0")
-• severity_threshold: Filter by severity - "all", "high", "medium", "low" (default: "all")
-
-## Returns
-• Detailed conflict analysis with severity levels
-• Conflicts grouped by severity (high/medium/low)
-• Statistics and recommendations
-• Timezone information (UTC)
-
-## Severity Levels
-• High: Exact overlaps, >60min overlap, or >30min time conflicts
-• Medium: Partial overlaps between 15-60 minutes
-• Low: All-day overlaps, <15min overlaps, or tentative events
-
-## Use Cases
-• Focus on high-severity conflicts only
-• Filter out minor overlaps (e.g., min_overlap_minutes="30")
-• Exclude all-day events from analysis
-• Get scheduling recommendations
-
-## Examples
-• analyze_calendar_conflicts("30", "false", "15", "high") - Next 30 days, high severity only, min 15min overlap
-• analyze_calendar_conflicts("7", "true", "0", "all") - Next week, include all conflicts
-
-## Related Tools
-• Use `get_calendar_conflicts` for simple conflict list
-• Use `get_week_events` to see all events
-• Use `search_calendar_events` to find specific events
-
-## Caching
-• Event data cached for {CacheTTL.CALENDAR_EVENTS//60} minutes
-• Advanced conflict analysis on cached events""",
+            description=_TOOL_DESCRIPTIONS["analyze_calendar_conflicts"],
             title="Analyze Calendar Conflicts",
             annotations={"title": "Analyze Calendar Conflicts"},
         )(self.analyze_conflicts_for_mcp)
@@ -1182,12 +1894,12 @@ Events matching the search query in:
         try:
             # Parse dates
             if start_date:
-                start = datetime.strptime(start_date, "%Y-%m-%d").date()
+                start = _parse_day(start_date)
             else:
                 start = date.today()
 
             if end_date:
-                end = datetime.strptime(end_date, "%Y-%m-%d").date()
+                end = _parse_day(end_date)
             else:
                 end = start + timedelta(days=7)
 
@@ -1204,13 +1916,18 @@ Events matching the search query in:
             return {"error": str(e)}
 
     def refresh_feeds_for_mcp(self) -> Dict[str, Any]:
-        """MCP tool wrapper for refresh_all_calendars"""
+        """MCP tool wrapper starting refresh_all_calendars in the background
+
+        Answers right away with the current feed information instead of
+        waiting on every feed's download. A request made while a refresh is
+        running is covered by that refresh rather than starting another.
+        """
         try:
-            self.refresh_all_calendars()
+            Thread(target=self._auto_refresh, name="ical-refresh", daemon=True).start()
             info = self.get_calendar_info()
             return {
                 "success": True,
-                "message": "All calendar feeds refreshed",
+                "message": "Refresh of all calendar feeds started",
                 "feeds": info,
             }
         except Exception as e:
@@ -1231,20 +1948,23 @@ Events matching the search query in:
         """Resource providing calendar information"""
         return self.get_calendar_info()
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS_TODAY)
     def get_today_events_resource(self) -> List[Dict[str, Any]]:
         """Resource providing today's events"""
         return self.get_today_events()
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_upcoming_events_resource(self) -> List[Dict[str, Any]]:
         """Resource providing upcoming events"""
         return self.get_upcoming_events(count=20)
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_events_on_date_resource(
         self, date: str, feed: Optional[str] = None
     ) -> Dict[str, Any]:
         """Resource providing events on a specific date, optionally filtered by feed"""
         try:
-            target_date = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC)
+            target_date = _utc_day_start(date)
             next_day = target_date + timedelta(days=1)
             feed_identifiers = [feed] if feed else None
             events = self.get_events(
@@ -1252,48 +1972,50 @@ Events matching the search query in:
                 end_date=next_day.isoformat(),
                 feed_identifiers=feed_identifiers,
             )
-            result = {"date": date, "events": events, "events_count": len(events)}
-            if feed:
-                result["feed"] = feed
-            return result
+            return {
+                "date": date,
+                "events": events,
+                "events_count": len(events),
+                **_feed_field(feed),
+            }
         except Exception as e:
             logger.error(f"Error getting events for date {date}: {e}")
             return {"error": str(e), "date": date}
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_events_between_resource(
         self, start_date: str, end_date: str, feed: Optional[str] = None
     ) -> Dict[str, Any]:
         """Resource providing events between two dates, optionally filtered by feed"""
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=UTC)
-            end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=UTC)
+            start = _utc_day_start(start_date)
+            end = _utc_day_start(end_date)
             feed_identifiers = [feed] if feed else None
             events = self.get_events(
                 start_date=start.isoformat(),
                 end_date=end.isoformat(),
                 feed_identifiers=feed_identifiers,
             )
-            result = {
+            return {
                 "start_date": start_date,
                 "end_date": end_date,
                 "events": events,
                 "events_count": len(events),
+                **_feed_field(feed),
             }
-            if feed:
-                result["feed"] = feed
-            return result
         except Exception as e:
             logger.error(
                 f"Error getting events between {start_date} and {end_date}: {e}"
             )
             return {"error": str(e), "start_date": start_date, "end_date": end_date}
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_events_after_resource(
         self, date: str, feed: Optional[str] = None
     ) -> Dict[str, Any]:
         """Resource providing events after a specific date, optionally filtered by feed"""
         try:
-            start = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC)
+            start = _utc_day_start(date)
             # Get events for the next 30 days
             end = start + timedelta(days=30)
             feed_identifiers = [feed] if feed else None
@@ -1302,19 +2024,18 @@ Events matching the search query in:
                 end_date=end.isoformat(),
                 feed_identifiers=feed_identifiers,
             )
-            result = {
+            return {
                 "after_date": date,
                 "events": events,
                 "events_count": len(events),
                 "note": "Shows events for 30 days after the specified date",
+                **_feed_field(feed),
             }
-            if feed:
-                result["feed"] = feed
-            return result
         except Exception as e:
             logger.error(f"Error getting events after {date}: {e}")
             return {"error": str(e), "after_date": date}
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def search_events_resource(
         self, query: str, feed: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -1322,14 +2043,17 @@ Events matching the search query in:
         try:
             feed_identifiers = [feed] if feed else None
             events = self.search_events(query, feed_identifiers=feed_identifiers)
-            result = {"query": query, "events": events, "events_count": len(events)}
-            if feed:
-                result["feed"] = feed
-            return result
+            return {
+                "query": query,
+                "events": events,
+                "events_count": len(events),
+                **_feed_field(feed),
+            }
         except Exception as e:
             logger.error(f"Error searching for events with query '{query}': {e}")
             return {"error": str(e), "query": query}
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def analyze_conflicts_for_mcp(
         self,
         days_ahead: str = "7",
@@ -1341,15 +2065,14 @@ Events matching the search query in:
         try:
             # Convert string parameters to appropriate types
             days = int(days_ahead)
-            include_all = include_all_day.lower() == "true"
+            include_all = include_all_day.lower() in TRUE_STRINGS
             min_overlap = int(min_overlap_minutes)
 
             # Validate severity threshold
-            valid_thresholds = ["all", "high", "medium", "low"]
-            if severity_threshold not in valid_thresholds:
+            if severity_threshold not in SEVERITY_THRESHOLDS:
                 return {
                     "error": f"Invalid severity_threshold: {severity_threshold}",
-                    "help": f"Must be one of: {', '.join(valid_thresholds)}",
+                    "help": f"Must be one of: {', '.join(SEVERITY_THRESHOLDS)}",
                     "examples": [
                         "all - Show all conflicts",
                         "high - Only high severity",
@@ -1390,12 +2113,9 @@ Events matching the search query in:
                     "name": feed.name,
                     "id": feed_id,
                     "url": feed.url,
-                    "event_count": (
-                        len(list(feed.calendar.walk())) if feed.calendar else 0
-                    ),
-                    "last_updated": (
-                        feed.last_fetch.isoformat() if feed.last_fetch else None
-                    ),
+                    # Counted once when the calendar was published
+                    "event_count": feed.event_count,
+                    "last_updated": feed.last_fetch_iso,
                 }
             )
 
@@ -1405,17 +2125,17 @@ Events matching the search query in:
             "usage": "Use feed name in ical://feed/{feed_name}/events to get events from a specific feed",
         }
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_week_events_resource(self) -> Dict[str, Any]:
         """Get all events for the current week"""
-        now = datetime.now(UTC)
+        today = _utc_midnight()
         # Get start of week (Monday)
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_of_week = today - timedelta(days=today.weekday())
         # Get end of week (Sunday)
         end_of_week = start_of_week + timedelta(days=7)
 
-        events = self.get_events(
-            start_date=start_of_week.isoformat(), end_date=end_of_week.isoformat()
+        events = self._get_events_impl(
+            start_of_week, end_of_week, list(self.feeds.values())
         )
 
         return {
@@ -1425,38 +2145,36 @@ Events matching the search query in:
             "events_count": len(events),
         }
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_month_events_resource(self) -> Dict[str, Any]:
         """Get all events for the current month"""
-        now = datetime.now(UTC)
         # Get first day of month
-        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        start_of_month = _utc_midnight().replace(day=1)
         # Get first day of next month
-        if now.month == 12:
-            end_of_month = start_of_month.replace(year=now.year + 1, month=1)
+        if start_of_month.month == 12:
+            end_of_month = start_of_month.replace(year=start_of_month.year + 1, month=1)
         else:
-            end_of_month = start_of_month.replace(month=now.month + 1)
+            end_of_month = start_of_month.replace(month=start_of_month.month + 1)
 
-        events = self.get_events(
-            start_date=start_of_month.isoformat(), end_date=end_of_month.isoformat()
+        events = self._get_events_impl(
+            start_of_month, end_of_month, list(self.feeds.values())
         )
 
         return {
-            "month": now.strftime("%B %Y"),
+            "month": start_of_month.strftime("%B %Y"),
             "month_start": start_of_month.isoformat(),
             "month_end": end_of_month.isoformat(),
             "events": events,
             "events_count": len(events),
         }
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_tomorrow_events_resource(self) -> Dict[str, Any]:
         """Get all events for tomorrow"""
-        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
+        tomorrow = _utc_midnight() + timedelta(days=1)
         day_after = tomorrow + timedelta(days=1)
 
-        events = self.get_events(
-            start_date=tomorrow.isoformat(), end_date=day_after.isoformat()
-        )
+        events = self._get_events_impl(tomorrow, day_after, list(self.feeds.values()))
 
         return {
             "date": tomorrow.date().isoformat(),
@@ -1464,6 +2182,7 @@ Events matching the search query in:
             "events_count": len(events),
         }
 
+    @_memoize_resource(CacheTTL.CALENDAR_EVENTS)
     def get_conflicts_resource(self, include_all_day: bool = False) -> Dict[str, Any]:
         """Find overlapping events in the next 7 days
 
@@ -1478,52 +2197,30 @@ Events matching the search query in:
         )
 
         conflicts = []
-        for i, event1 in enumerate(events):
-            # Check if event1 is all-day
-            is_all_day1 = self._is_all_day_event(event1)
-            if not include_all_day and is_all_day1:
-                continue  # Skip all-day events if not included
-
-            for event2 in events[i + 1 :]:
-                # Check if event2 is all-day
-                is_all_day2 = self._is_all_day_event(event2)
-                if not include_all_day and is_all_day2:
-                    continue  # Skip all-day events if not included
-
-                # Skip if both are all-day events (they don't really conflict)
-                if is_all_day1 and is_all_day2:
-                    continue
-
-                # Check if events overlap
-                start1 = self._normalize_datetime(event1.get("start"))
-                end1 = self._normalize_datetime(event1.get("end"))
-                start2 = self._normalize_datetime(event2.get("start"))
-                end2 = self._normalize_datetime(event2.get("end"))
-
-                if start1 and end1 and start2 and end2:
-                    # Check for overlap
-                    if start1 < end2 and end1 > start2:
-                        conflicts.append(
-                            {
-                                "event1": {
-                                    "summary": event1.get("summary"),
-                                    "start": event1.get("start"),
-                                    "end": event1.get("end"),
-                                    "all_day": is_all_day1,
-                                },
-                                "event2": {
-                                    "summary": event2.get("summary"),
-                                    "start": event2.get("start"),
-                                    "end": event2.get("end"),
-                                    "all_day": is_all_day2,
-                                },
-                                "conflict_type": (
-                                    "all_day_overlap"
-                                    if (is_all_day1 or is_all_day2)
-                                    else "time_overlap"
-                                ),
-                            }
-                        )
+        for i, j, span1, span2 in self._overlapping_pairs(events, include_all_day):
+            event1, event2 = events[i], events[j]
+            is_all_day1, is_all_day2 = span1.all_day, span2.all_day
+            conflicts.append(
+                {
+                    "event1": {
+                        "summary": event1.get("summary"),
+                        "start": event1.get("start"),
+                        "end": event1.get("end"),
+                        "all_day": is_all_day1,
+                    },
+                    "event2": {
+                        "summary": event2.get("summary"),
+                        "start": event2.get("start"),
+                        "end": event2.get("end"),
+                        "all_day": is_all_day2,
+                    },
+                    "conflict_type": (
+                        "all_day_overlap"
+                        if (is_all_day1 or is_all_day2)
+                        else "time_overlap"
+                    ),
+                }
+            )
 
         return {
             "period": f"{now.date().isoformat()} to {week_later.date().isoformat()}",
@@ -1533,6 +2230,83 @@ Events matching the search query in:
             "note": "All-day events excluded from conflicts by default. Set include_all_day=true to include them.",
         }
 
+    def _overlapping_pairs(
+        self, events: List[Dict[str, Any]], include_all_day: bool
+    ) -> List[Tuple[int, int, EventSpan, EventSpan]]:
+        """Overlapping events as (i, j, span_i, span_j) with i < j
+
+        Sweeps the events in start order, comparing each one only with the
+        earlier events still running at its start rather than with every
+        other event. Running events sit in heaps on their end, so those that
+        are over are popped instead of rescanned. Pairs come back in the order
+        of a nested i < j scan. Two all-day events never conflict, so running
+        all-day events are kept apart and only ever compared with timed events.
+        """
+        spans: Dict[int, EventSpan] = {}
+        for index, event in enumerate(events):
+            start = self._normalize_datetime(event.get("start"))
+            end = self._normalize_datetime(event.get("end"))
+            all_day = self._is_all_day_event(event, (start, end))
+            if all_day and not include_all_day:
+                continue
+            if start and end:
+                spans[index] = EventSpan(start, end, all_day)
+        order = sorted(spans, key=lambda index: (spans[index].start, index))
+
+        pairs = []
+        running_timed: List[Tuple[datetime, datetime, int]] = []
+        running_all_day: List[Tuple[datetime, datetime, int]] = []
+        for index in order:
+            start, end, all_day = spans[index]
+            # Events that ended by now cannot overlap any later start either
+            for running in (running_timed, running_all_day):
+                while running and running[0][0] <= start:
+                    heapq.heappop(running)
+            candidates = running_timed
+            if not all_day:
+                candidates = running_timed + running_all_day
+            for _, other_start, other in candidates:
+                if other_start < end:
+                    pairs.append((min(other, index), max(other, index)))
+            heapq.heappush(
+                running_all_day if all_day else running_timed, (end, start, index)
+            )
+
+        pairs.sort()
+        return [(i, j, spans[i], spans[j]) for i, j in pairs]
+
+    def _iter_conflicts(
+        self,
+        events: List[Dict[str, Any]],
+        include_all_day: bool,
+        min_overlap_minutes: int,
+        severity_threshold: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """Conflicts between the events that pass the filters, with their severity"""
+        # All-day flags and times are worked out once per event, and only
+        # overlapping pairs are analyzed in detail
+        for i, j, span1, span2 in self._overlapping_pairs(events, include_all_day):
+            event1, event2 = events[i], events[j]
+            conflict_info = self._analyze_event_overlap(event1, event2, span1, span2)
+
+            if (
+                conflict_info
+                and conflict_info["overlap_minutes"] >= min_overlap_minutes
+            ):
+                # Add severity level
+                conflict_info["severity"] = self._determine_conflict_severity(
+                    conflict_info, event1, event2
+                )
+
+                # Filter by severity threshold
+                if self._meets_severity_threshold(
+                    conflict_info["severity"], severity_threshold
+                ):
+                    yield conflict_info
+
+    # Shared across processes, keyed on the feed contents so a refresh that
+    # changes any feed makes earlier results unreachable
+    @cache_aside(CacheConfig(ttl=CacheTTL.CALENDAR_EVENTS), key_func=_conflicts_key)
     def analyze_calendar_conflicts(
         self,
         days_ahead: int = 7,
@@ -1560,58 +2334,22 @@ Events matching the search query in:
         )
 
         conflicts = []
+        # Grouped and counted as conflicts are found
+        conflicts_by_severity = {"high": [], "medium": [], "low": []}
+        conflicting_ids = set()
 
-        for i, event1 in enumerate(events):
-            # Check if event1 is all-day
-            is_all_day1 = self._is_all_day_event(event1)
-            if not include_all_day and is_all_day1:
-                continue
-
-            for event2 in events[i + 1 :]:
-                # Check if event2 is all-day
-                is_all_day2 = self._is_all_day_event(event2)
-                if not include_all_day and is_all_day2:
-                    continue
-
-                # Skip if both are all-day events
-                if is_all_day1 and is_all_day2:
-                    continue
-
-                # Check for overlap
-                conflict_info = self._analyze_event_overlap(
-                    event1, event2, is_all_day1, is_all_day2
-                )
-
-                if (
-                    conflict_info
-                    and conflict_info["overlap_minutes"] >= min_overlap_minutes
-                ):
-                    # Add severity level
-                    conflict_info["severity"] = self._determine_conflict_severity(
-                        conflict_info, event1, event2
-                    )
-
-                    # Filter by severity threshold
-                    if self._meets_severity_threshold(
-                        conflict_info["severity"], severity_threshold
-                    ):
-                        conflicts.append(conflict_info)
-
-        # Group conflicts by severity
-        conflicts_by_severity = {
-            "high": [c for c in conflicts if c["severity"] == "high"],
-            "medium": [c for c in conflicts if c["severity"] == "medium"],
-            "low": [c for c in conflicts if c["severity"] == "low"],
-        }
+        for conflict_info in self._iter_conflicts(
+            events, include_all_day, min_overlap_minutes, severity_threshold
+        ):
+            conflicts.append(conflict_info)
+            conflicts_by_severity[conflict_info["severity"]].append(conflict_info)
+            conflicting_ids.add(conflict_info["event1"]["id"])
+            conflicting_ids.add(conflict_info["event2"]["id"])
 
         # Calculate statistics
         stats = {
             "total_events": len(events),
-            "events_with_conflicts": len(
-                set(c["event1"]["id"] for c in conflicts).union(
-                    set(c["event2"]["id"] for c in conflicts)
-                )
-            ),
+            "events_with_conflicts": len(conflicting_ids),
             "conflict_percentage": (
                 round((len(conflicts) / max(len(events), 1)) * 100, 1) if events else 0
             ),
@@ -1644,31 +2382,23 @@ Events matching the search query in:
         }
 
     def _analyze_event_overlap(
-        self, event1: Dict, event2: Dict, is_all_day1: bool, is_all_day2: bool
+        self, event1: Dict, event2: Dict, span1: EventSpan, span2: EventSpan
     ) -> Optional[Dict]:
         """Analyze overlap between two events and return conflict details"""
-        start1 = self._normalize_datetime(event1.get("start"))
-        end1 = self._normalize_datetime(event1.get("end"))
-        start2 = self._normalize_datetime(event2.get("start"))
-        end2 = self._normalize_datetime(event2.get("end"))
-
-        if not all([start1, end1, start2, end2]):
-            return None
+        start1, end1, is_all_day1 = span1
+        start2, end2, is_all_day2 = span2
 
         # Check for overlap
         if not (start1 < end2 and end1 > start2):
             return None
 
-        # Calculate overlap duration
+        # Calculate overlap duration; zero-length events overlap nothing
         overlap_start = max(start1, start2)
         overlap_end = min(end1, end2)
-        overlap_duration = overlap_end - overlap_start
-
-        # Ensure we don't have negative overlap (shouldn't happen if overlap check is correct)
-        if overlap_duration.total_seconds() <= 0:
+        if overlap_end <= overlap_start:
             return None
 
-        overlap_minutes = max(0, int(overlap_duration.total_seconds() / 60))
+        overlap_minutes = int((overlap_end - overlap_start).total_seconds() / 60)
 
         # Determine conflict type
         if is_all_day1 or is_all_day2:
@@ -1737,15 +2467,7 @@ Events matching the search query in:
 
     def _meets_severity_threshold(self, severity: str, threshold: str) -> bool:
         """Check if a conflict severity meets the threshold"""
-        severity_levels = {"low": 1, "medium": 2, "high": 3}
-
-        if threshold == "all":
-            return True
-
-        threshold_level = severity_levels.get(threshold, 0)
-        conflict_level = severity_levels.get(severity, 0)
-
-        return conflict_level >= threshold_level
+        return SEVERITY_LEVELS.get(severity, 0) >= SEVERITY_LEVELS.get(threshold, 0)
 
     def _generate_conflict_recommendations(
         self, conflicts_by_severity: Dict
@@ -1789,8 +2511,15 @@ Events matching the search query in:
 
         return recommendations
 
-    def _is_all_day_event(self, event: Dict[str, Any]) -> bool:
-        """Check if an event is an all-day event"""
+    def _is_all_day_event(
+        self,
+        event: Dict[str, Any],
+        times: Optional[Tuple[Optional[datetime], Optional[datetime]]] = None,
+    ) -> bool:
+        """Check if an event is an all-day event
+
+        times: the event's start and end already normalized, when at hand
+        """
         # Check if the event has no time component (just date)
         start = event.get("start", "")
         end = event.get("end", "")
@@ -1803,24 +2532,18 @@ Events matching the search query in:
             return True
 
         # Check if duration is exactly 24 hours or multiples
-        try:
-            start_dt = self._normalize_datetime(start)
-            end_dt = self._normalize_datetime(end)
-            if start_dt and end_dt:
-                duration = end_dt - start_dt
-                # Check if duration is exactly 1 or more days
-                if (
-                    duration.total_seconds() % 86400 == 0
-                    and duration.total_seconds() >= 86400
-                ):
-                    # And starts at midnight
-                    if start_dt.hour == 0 and start_dt.minute == 0:
-                        return True
-        except Exception as exc:
-            logger.debug(
-                "Failed to evaluate all-day event duration for event %r: %s",
-                event.get("uid") or event.get("summary"),
-                exc,
-            )
+        if times is None:
+            times = (self._normalize_datetime(start), self._normalize_datetime(end))
+        start_dt, end_dt = times
+        # Unparseable times normalize to None, and both are in UTC otherwise
+        if start_dt is None or end_dt is None:
+            return False
+
+        duration = end_dt - start_dt
+        # Check if duration is exactly 1 or more days
+        if duration.total_seconds() % 86400 == 0 and duration.total_seconds() >= 86400:
+            # And starts at midnight
+            if start_dt.hour == 0 and start_dt.minute == 0:
+                return True
 
         return False
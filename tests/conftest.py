@@ -5,13 +5,12 @@ import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 from datetime import datetime, timezone, timedelta
 
-
 # ============================================================================
 # iCalendar Fixtures
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ical_data():
     """Sample iCalendar data for testing"""
     return """BEGIN:VCALENDAR
@@ -35,7 +34,7 @@ END:VEVENT
 END:VCALENDAR"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ical_with_timezone():
     """Sample iCalendar data with timezone information"""
     return """BEGIN:VCALENDAR
@@ -65,41 +64,54 @@ END:VEVENT
 END:VCALENDAR"""
 
 
+# Lines around the events of every mocked feed
+VCALENDAR_HEADER = "BEGIN:VCALENDAR\nVERSION:2.0"
+VCALENDAR_FOOTER = "END:VCALENDAR"
+
+
 @pytest.fixture
 def mock_ical_feeds():
     """Mock iCalendar feed URLs and responses"""
-    with patch("requests.get") as mock_get:
-
-        def side_effect(url, *args, **kwargs):
-            response = MagicMock()
-            response.status_code = 200
 
-            if "personal" in url:
-                response.text = """BEGIN:VCALENDAR
-VERSION:2.0
-BEGIN:VEVENT
+    def feed_response(*events):
+        """A downloaded calendar holding the given VEVENT blocks"""
+        text = "\n".join((VCALENDAR_HEADER, *events, VCALENDAR_FOOTER))
+        content = text.encode("utf-8")
+        response = MagicMock()
+        response.status_code = 200
+        response.text = text
+        response.content = content
+        response.headers = {}
+        response.iter_content.side_effect = lambda chunk_size=1: iter((content,))
+        # Streamed responses are used as context managers
+        response.__enter__.return_value = response
+        response.__exit__.return_value = None
+        return response
+
+    # Built once and routed by URL, "personal" is checked before "work"
+    responses = {
+        "personal": feed_response("""BEGIN:VEVENT
 UID:personal-1@example.com
 DTSTART:20240101T090000Z
 DTEND:20240101T100000Z
 SUMMARY:Personal Event
-END:VEVENT
-END:VCALENDAR"""
-            elif "work" in url:
-                response.text = """BEGIN:VCALENDAR
-VERSION:2.0
-BEGIN:VEVENT
+END:VEVENT"""),
+        "work": feed_response("""BEGIN:VEVENT
 UID:work-1@example.com
 DTSTART:20240101T090000Z
 DTEND:20240101T100000Z
 SUMMARY:Work Meeting
-END:VEVENT
-END:VCALENDAR"""
-            else:
-                response.text = """BEGIN:VCALENDAR
-VERSION:2.0
-END:VCALENDAR"""
+END:VEVENT"""),
+    }
+    empty = feed_response()
 
-            return response
+    with patch("requests.get") as mock_get:
+
+        def side_effect(url, *args, **kwargs):
+            for key, response in responses.items():
+                if key in url:
+                    return response
+            return empty
 
         mock_get.side_effect = side_effect
         yield mock_get
@@ -110,14 +122,33 @@ END:VCALENDAR"""
 # ============================================================================
 
 
+class FakeFastMCP:
+    """FastMCP stand-in that records registrations and leaves functions as is"""
+
+    __slots__ = ("tool_calls", "resource_calls", "prompt_calls")
+
+    def __init__(self):
+        self.tool_calls = []
+        self.resource_calls = []
+        self.prompt_calls = []
+
+    def tool(self, *args, **kwargs):
+        self.tool_calls.append((args, kwargs))
+        return lambda func: func
+
+    def resource(self, *args, **kwargs):
+        self.resource_calls.append((args, kwargs))
+        return lambda func: func
+
+    def prompt(self, *args, **kwargs):
+        self.prompt_calls.append((args, kwargs))
+        return lambda func: func
+
+
 @pytest.fixture
 def mock_fastmcp():
     """Mock FastMCP server"""
-    mock_mcp = MagicMock()
-    mock_mcp.tool = MagicMock(return_value=lambda func: func)
-    mock_mcp.resource = MagicMock(return_value=lambda func: func)
-    mock_mcp.prompt = MagicMock(return_value=lambda func: func)
-    return mock_mcp
+    return FakeFastMCP()
 
 
 @pytest.fixture
@@ -1,144 +1,184 @@
 """Tests for get_current_datetime tool"""
 
-import os
-from datetime import datetime
+import re
+from datetime import datetime, timezone
 from unittest.mock import patch
 
+import pytest
 
-def test_get_current_datetime_utc():
-    """Test get_current_datetime with default UTC timezone"""
-    with patch.dict(os.environ, {"TIMEZONE": "UTC"}):
-        # Import the function
-        from src.server import get_current_datetime
-
-        result = get_current_datetime()
-
-        # Verify all expected fields are present
-        assert "date" in result
-        assert "time" in result
-        assert "datetime" in result
-        assert "timezone" in result
-        assert "utc_offset" in result
-        assert "timezone_abbr" in result
-        assert "day_of_week" in result
-        assert "timestamp" in result
-
-        # Verify timezone
-        assert result["timezone"] == "UTC"
-        assert result["utc_offset"] == "+0000"
-
-        # Verify date format (YYYY-MM-DD)
-        assert len(result["date"]) == 10
-        assert result["date"].count("-") == 2
-
-        # Verify time format (HH:MM:SS)
-        assert len(result["time"]) == 8
-        assert result["time"].count(":") == 2
-
-        # Verify ISO datetime format
-        assert "T" in result["datetime"]
-
-        # Verify day of week is a valid day name
-        valid_days = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        assert result["day_of_week"] in valid_days
-
-        # Verify timestamp is a reasonable integer
-        assert isinstance(result["timestamp"], int)
-        assert result["timestamp"] > 1700000000  # After Nov 2023
-
-
-def test_get_current_datetime_custom_timezone():
-    """Test get_current_datetime with custom timezone"""
-    with patch.dict(os.environ, {"TIMEZONE": "America/New_York"}):
-        from src.server import get_current_datetime
-
-        result = get_current_datetime()
-
-        # Verify timezone
-        assert result["timezone"] == "America/New_York"
-
-        # Verify offset (should be -0400 or -0500 depending on DST)
-        assert result["utc_offset"] in ["-0400", "-0500"]
-        assert result["timezone_abbr"] in ["EDT", "EST"]
+from src import server
+from src.server import _resolve_timezone, get_current_datetime
 
+# Formats of the date, time and datetime fields
+DATE_FORMAT = re.compile(r"\d{4}-\d{2}-\d{2}")
+TIME_FORMAT = re.compile(r"\d{2}:\d{2}:\d{2}")
+DATETIME_FORMAT = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
 
-def test_get_current_datetime_asia_timezone():
-    """Test get_current_datetime with Asian timezone"""
-    with patch.dict(os.environ, {"TIMEZONE": "Asia/Tokyo"}):
-        from src.server import get_current_datetime
+VALID_DAYS = frozenset(
+    ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+)
 
-        result = get_current_datetime()
 
-        # Verify timezone
-        assert result["timezone"] == "Asia/Tokyo"
+@pytest.fixture(autouse=True)
+def clear_timezone_cache():
+    """Resolve timezones anew in every test, each patches TIMEZONE itself"""
+    _resolve_timezone.cache_clear()
 
-        # Verify positive offset for Tokyo
-        assert result["utc_offset"] == "+0900"
-        assert result["timezone_abbr"] == "JST"
 
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze the clock of src.server, returns a setter for the UTC instant"""
 
-def test_get_current_datetime_invalid_timezone_fallback():
-    """Test that invalid timezone falls back to UTC"""
-    with patch.dict(os.environ, {"TIMEZONE": "Invalid/Timezone"}):
-        from src.server import get_current_datetime
+    class FrozenDatetime(datetime):
+        instant = None
 
-        result = get_current_datetime()
+        @classmethod
+        def now(cls, tz=None):
+            return cls.instant.astimezone(tz)
 
-        # Should fall back to UTC
-        assert result["timezone"] == "UTC"
-        assert result["utc_offset"] == "+0000"
+    monkeypatch.setattr(server, "datetime", FrozenDatetime)
 
+    def freeze(instant):
+        FrozenDatetime.instant = instant
 
-def test_get_current_datetime_no_timezone_env():
-    """Test get_current_datetime when TIMEZONE env var is not set"""
-    with patch.dict(os.environ, {}, clear=True):
-        from src.server import get_current_datetime
+    return freeze
 
-        result = get_current_datetime()
 
-        # Should default to UTC
-        assert result["timezone"] == "UTC"
-        assert result["utc_offset"] == "+0000"
-
-
-def test_get_current_datetime_europe_timezone():
-    """Test get_current_datetime with European timezone"""
-    with patch.dict(os.environ, {"TIMEZONE": "Europe/London"}):
-        from src.server import get_current_datetime
-
-        result = get_current_datetime()
-
-        # Verify timezone
-        assert result["timezone"] == "Europe/London"
-
-        # Verify offset (should be +0000 or +0100 depending on DST)
-        assert result["utc_offset"] in ["+0000", "+0100"]
-        assert result["timezone_abbr"] in ["GMT", "BST"]
-
-
-def test_datetime_fields_are_synchronized():
+def test_get_current_datetime_utc(monkeypatch):
+    """Test get_current_datetime with default UTC timezone"""
+    monkeypatch.setenv("TIMEZONE", "UTC")
+    result = get_current_datetime()
+
+    # Verify all expected fields are present
+    assert "date" in result
+    assert "time" in result
+    assert "datetime" in result
+    assert "timezone" in result
+    assert "utc_offset" in result
+    assert "timezone_abbr" in result
+    assert "day_of_week" in result
+    assert "timestamp" in result
+
+    # Verify timezone
+    assert result["timezone"] == "UTC"
+    assert result["utc_offset"] == "+0000"
+
+    # Verify date format (YYYY-MM-DD)
+    assert DATE_FORMAT.fullmatch(result["date"])
+
+    # Verify time format (HH:MM:SS)
+    assert TIME_FORMAT.fullmatch(result["time"])
+
+    # Verify ISO datetime format
+    assert DATETIME_FORMAT.match(result["datetime"])
+
+    # Verify day of week is a valid day name
+    assert result["day_of_week"] in VALID_DAYS
+
+    # Verify timestamp is a reasonable integer
+    assert isinstance(result["timestamp"], int)
+    assert result["timestamp"] > 1700000000  # After Nov 2023
+
+
+@pytest.mark.parametrize(
+    "timezone_name, expected_timezone, expected_offsets, expected_abbrs",
+    [
+        # Offsets and abbreviations depend on DST
+        ("America/New_York", "America/New_York", {"-0400", "-0500"}, {"EDT", "EST"}),
+        ("Asia/Tokyo", "Asia/Tokyo", {"+0900"}, {"JST"}),
+        ("Europe/London", "Europe/London", {"+0000", "+0100"}, {"GMT", "BST"}),
+        # Invalid and unset timezones fall back to UTC
+        ("Invalid/Timezone", "UTC", {"+0000"}, {"UTC"}),
+        (None, "UTC", {"+0000"}, {"UTC"}),
+    ],
+)
+def test_get_current_datetime_timezones(
+    monkeypatch, timezone_name, expected_timezone, expected_offsets, expected_abbrs
+):
+    """Test get_current_datetime in configured, invalid and missing timezones"""
+    if timezone_name is None:
+        monkeypatch.delenv("TIMEZONE", raising=False)
+    else:
+        monkeypatch.setenv("TIMEZONE", timezone_name)
+
+    result = get_current_datetime()
+
+    assert result["timezone"] == expected_timezone
+    assert result["utc_offset"] in expected_offsets
+    assert result["timezone_abbr"] in expected_abbrs
+
+
+def test_datetime_fields_are_synchronized(monkeypatch, frozen_now):
     """Test that all datetime fields represent the same moment in time"""
-    with patch.dict(os.environ, {"TIMEZONE": "America/Los_Angeles"}):
-        from src.server import get_current_datetime
-
-        result = get_current_datetime()
-
-        # Parse the ISO datetime
-        dt_from_iso = datetime.fromisoformat(result["datetime"])
-
-        # Verify the date matches
-        assert dt_from_iso.strftime("%Y-%m-%d") == result["date"]
-
-        # Verify the time matches (within same second)
-        assert dt_from_iso.strftime("%H:%M:%S") == result["time"]
-
-        # Verify timestamp represents the same time
-        assert int(dt_from_iso.timestamp()) == result["timestamp"]
+    monkeypatch.setenv("TIMEZONE", "America/Los_Angeles")
+    # A microsecond before 02:00 local, where daylight time starts
+    frozen_now(datetime(2024, 3, 10, 9, 59, 59, 999999, tzinfo=timezone.utc))
+    result = get_current_datetime()
+
+    # Parse the ISO datetime
+    dt_from_iso = datetime.fromisoformat(result["datetime"])
+
+    # Verify the date matches
+    assert dt_from_iso.strftime("%Y-%m-%d") == result["date"]
+
+    # Verify the time matches (within same second)
+    assert dt_from_iso.strftime("%H:%M:%S") == result["time"]
+
+    # Verify timestamp represents the same time
+    assert int(dt_from_iso.timestamp()) == result["timestamp"]
+    assert (result["date"], result["time"], result["utc_offset"]) == (
+        "2024-03-10",
+        "01:59:59",
+        "-0800",
+    )
+
+
+def test_get_current_datetime_invalid_timezone_warns_once(monkeypatch):
+    """Test that an invalid timezone is only resolved and reported once"""
+    monkeypatch.setenv("TIMEZONE", "Invalid/Timezone")
+    with patch.object(server.logger, "warning") as mock_warning:
+        first = server.get_current_datetime()
+        second = server.get_current_datetime()
+
+    assert first["timezone"] == second["timezone"] == "UTC"
+    mock_warning.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "instant, expected",
+    [
+        (
+            datetime(2024, 1, 15, 17, 4, 5, tzinfo=timezone.utc),
+            {
+                "date": "2024-01-15",
+                "time": "12:04:05",
+                "utc_offset": "-0500",
+                "timezone_abbr": "EST",
+                "day_of_week": "Monday",
+            },
+        ),
+        (
+            datetime(2024, 7, 1, 2, 30, 0, 123456, tzinfo=timezone.utc),
+            {
+                "date": "2024-06-30",
+                "time": "22:30:00",
+                "utc_offset": "-0400",
+                "timezone_abbr": "EDT",
+                "day_of_week": "Sunday",
+            },
+        ),
+    ],
+)
+def test_get_current_datetime_fields_at_fixed_time(
+    monkeypatch, frozen_now, instant, expected
+):
+    """Test every field against a frozen clock, in standard and daylight time"""
+    monkeypatch.setenv("TIMEZONE", "America/New_York")
+    frozen_now(instant)
+
+    result = get_current_datetime()
+
+    assert {key: result[key] for key in expected} == expected
+    assert result["timezone"] == "America/New_York"
+    assert datetime.fromisoformat(result["datetime"]) == instant
+    assert result["timestamp"] == int(instant.timestamp())
@@ -0,0 +1,36 @@
+"""Tests for environment loading"""
+
+import os
+from unittest.mock import patch
+
+from src import env
+
+
+def test_load_environment_precedence(tmp_path, monkeypatch):
+    """Test that .env.local overrides .env and existing variables are kept"""
+    (tmp_path / ".env").write_text("CMCP_A=env\nCMCP_B=env\nCMCP_C=env\n")
+    (tmp_path / ".env.local").write_text("CMCP_A=local\n")
+    monkeypatch.chdir(tmp_path)
+
+    with patch.dict(os.environ, {"CMCP_C": "existing"}), patch.object(
+        env, "_loaded", False
+    ):
+        env.load_environment()
+
+        assert os.environ["CMCP_A"] == "local"
+        assert os.environ["CMCP_B"] == "env"
+        assert os.environ["CMCP_C"] == "existing"
+
+
+def test_load_environment_runs_once(tmp_path, monkeypatch):
+    """Test that the files are only parsed on the first call"""
+    (tmp_path / ".env").write_text("CMCP_A=env\n")
+    monkeypatch.chdir(tmp_path)
+
+    with patch.dict(os.environ), patch.object(env, "_loaded", False), patch.object(
+        env, "dotenv_values", wraps=env.dotenv_values
+    ) as mock_values:
+        env.load_environment()
+        env.load_environment()
+
+    assert mock_values.call_count == 1
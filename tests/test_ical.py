@@ -1,13 +1,35 @@
 """Unit tests for iCalendar service"""
 
 import pytest
-from unittest.mock import MagicMock, patch, Mock
-from datetime import datetime, timezone
-from src.services.ical import MultiCalendarService, CalendarFeed
-from icalendar import Calendar, Event
+import threading
+from unittest.mock import MagicMock, patch
+from datetime import date, datetime, timedelta, timezone
+from src.services.ical import (
+    MultiCalendarService,
+    CalendarFeed,
+    RepeatingTimer,
+    _TOOL_DESCRIPTIONS,
+    _conflicts_key,
+    _parse_day,
+    _search_terms,
+)
+from icalendar import Calendar, Event, Timezone
 import requests
 
 
+def _feed_response(content=b"", status_code=200, headers=None):
+    """Mock of a streamed requests response, closed when its block exits"""
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.iter_content.side_effect = lambda chunk_size=1: (
+        content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+    )
+    response.__enter__.return_value = response
+    # Returns None like close(), so exceptions leaving the block propagate
+    response.close.return_value = None
+    response.__exit__.side_effect = lambda *exc_info: response.close()
+    return response
+
+
 class TestCalendarFeed:
     """Test suite for CalendarFeed class"""
 
@@ -39,6 +61,43 @@ class TestCalendarFeed:
         feed2 = CalendarFeed(url="https://example.com/calendar.ics")
         assert feed.id == feed2.id
 
+    def test_slots(self):
+        """Test that feeds only hold their declared attributes"""
+        feed = CalendarFeed(url="https://example.com/calendar.ics", name="Work")
+        assert not hasattr(feed, "__dict__")
+        assert feed.name_lower == "work"
+        with pytest.raises(AttributeError):
+            feed.unknown = True
+
+    def test_calendar_summaries(self):
+        """Test that the event count and display name follow the calendar"""
+        feed = CalendarFeed(url="https://example.com/calendar.ics", name="Work")
+        assert feed.event_count == 0
+        assert feed.display_name is None
+
+        cal = Calendar()
+        cal.add("X-WR-CALNAME", "Team Calendar")
+        cal.add_component(Timezone())
+        cal.add_component(Event())
+        feed.calendar = cal
+
+        assert feed.event_count == 1
+        assert feed.display_name == "Team Calendar"
+
+        feed.calendar = None
+        assert feed.event_count == 0
+        assert feed.display_name is None
+
+    def test_last_fetch_iso(self):
+        """Test that the formatted fetch time follows last_fetch"""
+        feed = CalendarFeed(url="https://example.com/calendar.ics", name="Work")
+        assert feed.last_fetch_iso is None
+
+        fetched = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        feed.last_fetch = fetched
+        assert feed.last_fetch is fetched
+        assert feed.last_fetch_iso == "2024-01-02T03:04:05+00:00"
+
 
 class TestMultiCalendarService:
     """Test suite for MultiCalendarService"""
@@ -68,6 +127,57 @@ class TestMultiCalendarService:
         service = MultiCalendarService([], refresh_interval_minutes=60)
         assert len(service.feeds) == 0
 
+    @patch("src.services.ical.MultiCalendarService._schedule_refresh")
+    def test_init_registers_mcp_tools(self, mock_schedule, mock_fastmcp):
+        """Test that a service given an MCP server registers its tools"""
+        MultiCalendarService([], mcp=mock_fastmcp)
+
+        names = [kwargs["name"] for _, kwargs in mock_fastmcp.tool_calls]
+        assert names == [
+            "refresh_calendar_feeds",
+            "get_calendar_info",
+            "get_today_events",
+            "get_upcoming_events",
+            "get_events_on_date",
+            "get_events_between_dates",
+            "get_events_after_date",
+            "search_calendar_events",
+            "get_calendar_feeds",
+            "get_week_events",
+            "get_month_events",
+            "get_tomorrow_events",
+            "get_calendar_conflicts",
+            "analyze_calendar_conflicts",
+        ]
+        for _, kwargs in mock_fastmcp.tool_calls:
+            assert kwargs["description"] == _TOOL_DESCRIPTIONS[kwargs["name"]]
+            assert kwargs["annotations"] == {"title": kwargs["title"]}
+        # Read-only data is exposed as tools, nothing else is registered
+        assert mock_fastmcp.resource_calls == []
+        assert mock_fastmcp.prompt_calls == []
+
+    def test_init_fetches_configured_feeds(self, mock_ical_feeds):
+        """Test that the feeds configured at startup are downloaded and queried"""
+        service = MultiCalendarService(
+            [
+                {"url": "https://example.com/personal.ics", "name": "Personal"},
+                {"url": "https://example.com/work.ics", "name": "Work"},
+                {"url": "https://example.com/holidays.ics", "name": "Holidays"},
+            ]
+        )
+        service.stop()
+
+        assert mock_ical_feeds.call_count == 3
+        assert [
+            feed["event_count"] for feed in service.get_calendar_info()["feeds"]
+        ] == [1, 1, 0]
+
+        events = service.get_events(start_date="2024-01-01", end_date="2024-01-02")
+        assert [(e["source_feed_name"], e["summary"]) for e in events] == [
+            ("Personal", "Personal Event"),
+            ("Work", "Work Meeting"),
+        ]
+
     # ========== VALIDATION TESTS ==========
 
     def test_validate_url_valid(self):
@@ -108,6 +218,20 @@ class TestMultiCalendarService:
         with pytest.raises(ValueError, match="Invalid .* format"):
             service._validate_date_format(date_str, "test_date")
 
+    @pytest.mark.parametrize(
+        "date_str",
+        ["2024-12-31", "2024-1-5", "20241231", "2024-02-30", "2024-12-31T10:00"],
+    )
+    def test_parse_day_matches_strptime(self, date_str):
+        """Test that the fast date parser accepts exactly what strptime accepts"""
+        try:
+            expected = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            with pytest.raises(ValueError):
+                _parse_day(date_str)
+        else:
+            assert _parse_day(date_str) == expected
+
     def test_validate_feed_exists_valid(self):
         """Test feed validation with existing feed"""
         service = MultiCalendarService([])
@@ -121,6 +245,29 @@ class TestMultiCalendarService:
         result = service._validate_feed_exists("Test")
         assert result == feed
 
+    def test_find_feed_by_id_url_and_name(self):
+        """Test that feed lookups follow registrations, replacements and removals"""
+        service = MultiCalendarService([])
+        service.stop()
+        first = CalendarFeed("https://example.com/a.ics", "Shared")
+        second = CalendarFeed("https://example.com/b.ics", "Shared")
+        service.feeds[first.id] = first
+        service.feeds[second.id] = second
+
+        assert service._find_feed(second.id) is second
+        assert service._find_feed("https://example.com/b.ics") is second
+        # Names resolve to the first feed registered with them
+        assert service._find_feed("Shared") is first
+
+        del service.feeds[first.id]
+        assert service._find_feed("Shared") is second
+        assert service._find_feed("https://example.com/a.ics") is None
+
+        renamed = CalendarFeed("https://example.com/b.ics", "Renamed")
+        service.feeds[second.id] = renamed
+        assert service._find_feed("Renamed") is renamed
+        assert service._find_feed("Shared") is None
+
     def test_validate_feed_exists_invalid(self):
         """Test feed validation with non-existent feed"""
         service = MultiCalendarService([])
@@ -128,6 +275,43 @@ class TestMultiCalendarService:
         with pytest.raises(ValueError, match="Calendar feed .* not found"):
             service._validate_feed_exists("nonexistent")
 
+    def test_get_events_resolves_each_identifier_once(self):
+        """Test that get_events looks up each requested feed a single time"""
+        service = MultiCalendarService([])
+        service.stop()
+        for name in ["Work", "Home"]:
+            feed = CalendarFeed(f"https://example.com/{name.lower()}.ics", name)
+            service.feeds[feed.id] = feed
+
+        with patch.object(service, "_find_feed", wraps=service._find_feed) as mock_find:
+            service.get_events(feed_identifiers=["Work", "Home"])
+
+        assert [call.args for call in mock_find.call_args_list] == [
+            ("Work",),
+            ("Home",),
+        ]
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2024-01-01", datetime(2024, 1, 1, tzinfo=timezone.utc)),
+            ("2024-01-01T10:00:00Z", datetime(2024, 1, 1, 10, tzinfo=timezone.utc)),
+            (
+                "2024-01-01T10:00:00+05:30",
+                datetime(2024, 1, 1, 4, 30, tzinfo=timezone.utc),
+            ),
+            ("Jan 5 2024 10:00", datetime(2024, 1, 5, 10, tzinfo=timezone.utc)),
+            (datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 10, tzinfo=timezone.utc)),
+            ("not a date", None),
+        ],
+    )
+    def test_normalize_datetime(self, value, expected):
+        """Test that ISO and free-form inputs are normalized to UTC"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        assert service._normalize_datetime(value) == expected
+
     # ========== FEED MANAGEMENT TESTS ==========
 
     def test_list_feeds(self):
@@ -157,9 +341,7 @@ class TestMultiCalendarService:
         service.feeds[feed.id] = feed
 
         # Mock response
-        mock_response = Mock()
-        mock_response.text = "mock calendar data"
-        mock_response.raise_for_status = Mock()
+        mock_response = _feed_response(b"mock calendar data")
         mock_get.return_value = mock_response
 
         # Mock calendar parsing
@@ -168,6 +350,9 @@ class TestMultiCalendarService:
 
         result = service._refresh_single_calendar(feed)
 
+        mock_from_ical.assert_called_once_with(b"mock calendar data")
+        mock_response.close.assert_called_once()
+
         assert result["status"] == "success"
         assert feed.calendar is not None
         assert feed.last_fetch is not None
@@ -199,10 +384,9 @@ class TestMultiCalendarService:
         service.feeds[feed2.id] = feed2
 
         # Mock responses
-        mock_response = Mock()
-        mock_response.text = "mock calendar data"
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.side_effect = lambda *args, **kwargs: _feed_response(
+            b"mock calendar data"
+        )
 
         # Mock calendar parsing
         mock_calendar = MagicMock()
@@ -213,6 +397,214 @@ class TestMultiCalendarService:
         assert mock_get.call_count == 2
         assert result["feeds_refreshed"] == 2
 
+    @patch("icalendar.Calendar.from_ical")
+    @patch("requests.get")
+    def test_refresh_does_not_hold_lock_while_fetching(self, mock_get, mock_from_ical):
+        """Test that the service lock is free while feeds are being fetched"""
+        service = MultiCalendarService([])
+
+        feed1 = CalendarFeed("https://example.com/feed1.ics", "Feed 1")
+        feed2 = CalendarFeed("https://example.com/feed2.ics", "Feed 2")
+        service.feeds[feed1.id] = feed1
+        service.feeds[feed2.id] = feed2
+
+        lock_free_during_fetch = []
+
+        def fetch(url, *args, **kwargs):
+            acquired = service._lock.acquire(blocking=False)
+            if acquired:
+                service._lock.release()
+            lock_free_during_fetch.append(acquired)
+            return _feed_response(url.encode())
+
+        mock_get.side_effect = fetch
+        mock_from_ical.return_value = MagicMock()
+
+        result = service.refresh_all_calendars()
+
+        assert lock_free_during_fetch == [True, True]
+        # Results keep the feed order
+        assert [r["feed_name"] for r in result["results"]] == ["Feed 1", "Feed 2"]
+
+    @patch("requests.get")
+    def test_refresh_persists_and_reuses_feed_body(self, mock_get, sample_ical_data):
+        """Test that the initial load uses a cached feed body instead of downloading"""
+        stored = {}
+        cache = MagicMock()
+        cache.set.side_effect = lambda key, value, ttl=None: stored.update({key: value})
+        cache.get.side_effect = lambda key: stored.get(key)
+
+        mock_get.side_effect = lambda *args, **kwargs: _feed_response(
+            sample_ical_data.encode()
+        )
+        feed_configs = [{"url": "https://example.com/test.ics", "name": "Test"}]
+
+        # First process downloads the feed and persists the body
+        service = MultiCalendarService(feed_configs, cache=cache)
+        service.stop()
+        assert mock_get.call_count == 1
+        assert len(stored) == 1
+
+        # A restarted process loads it from the cache
+        mock_get.reset_mock()
+        restarted = MultiCalendarService(feed_configs, cache=cache)
+        restarted.stop()
+        mock_get.assert_not_called()
+        feed = next(iter(restarted.feeds.values()))
+        assert restarted.get_calendar_info()["feeds"][0]["event_count"] == 2
+        assert feed.last_fetch is not None
+
+        # Explicit refreshes always go to the network
+        restarted.refresh_all_calendars()
+        assert mock_get.call_count == 1
+
+    @patch("requests.get")
+    def test_refresh_sends_conditional_request(self, mock_get, sample_ical_data):
+        """Test that validators are sent back and a 304 keeps the calendar"""
+        service = MultiCalendarService([])
+        service.stop()
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        service.feeds[feed.id] = feed
+
+        mock_get.return_value = _feed_response(
+            sample_ical_data.encode(),
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+        assert service._refresh_single_calendar(feed)["status"] == "success"
+        assert mock_get.call_args.kwargs["headers"] == {}
+        calendar = feed.calendar
+
+        mock_get.return_value = _feed_response(status_code=304)
+        with patch("icalendar.Calendar.from_ical") as mock_from_ical:
+            result = service._refresh_single_calendar(feed)
+            mock_from_ical.assert_not_called()
+
+        # The 304 response is released without reading a body
+        mock_get.return_value.close.assert_called_once()
+        mock_get.return_value.iter_content.assert_not_called()
+
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert result["status"] == "not_modified"
+        assert result["event_count"] == 2
+        assert feed.calendar is calendar
+
+    @patch("requests.get")
+    def test_refresh_skips_parsing_identical_body(self, mock_get, sample_ical_data):
+        """Test that a resent, byte-identical body keeps the parsed calendar"""
+        service = MultiCalendarService([])
+        service.stop()
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        service.feeds[feed.id] = feed
+
+        mock_get.return_value = _feed_response(sample_ical_data.encode())
+        service._refresh_single_calendar(feed)
+        calendar, version = feed.calendar, feed.version
+
+        with patch(
+            "icalendar.Calendar.from_ical", wraps=Calendar.from_ical
+        ) as mock_from_ical:
+            result = service._refresh_single_calendar(feed)
+            mock_from_ical.assert_not_called()
+
+            assert result["status"] == "success"
+            assert result["event_count"] == 2
+            assert feed.calendar is calendar
+            assert feed.version == version
+
+            mock_get.return_value = _feed_response(
+                sample_ical_data.replace("Test Event 1", "Renamed").encode()
+            )
+            service._refresh_single_calendar(feed)
+            mock_from_ical.assert_called_once()
+
+        assert feed.calendar is not calendar
+
+    @patch("requests.get")
+    def test_refresh_rejects_oversized_feed(self, mock_get):
+        """Test that a feed declaring a size over the limit is not downloaded"""
+        service = MultiCalendarService([], max_feed_bytes=1024)
+        service.stop()
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+
+        response = _feed_response(b"x" * 2048, headers={"Content-Length": "2048"})
+        mock_get.return_value = response
+
+        result = service._refresh_single_calendar(feed)
+
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert result["status"] == "error"
+        assert "above the limit" in result["error"]
+        response.iter_content.assert_not_called()
+        response.close.assert_called_once()
+        assert feed.calendar is None
+
+    @patch("requests.get")
+    def test_refresh_stops_undeclared_oversized_feed(self, mock_get):
+        """Test that a feed without Content-Length is cut off at the limit"""
+        service = MultiCalendarService([], max_feed_bytes=1024)
+        service.stop()
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+
+        chunks = []
+
+        def endless_body(chunk_size=1):
+            while True:
+                chunks.append(b"x" * 512)
+                yield chunks[-1]
+
+        response = _feed_response()
+        response.iter_content.side_effect = endless_body
+        mock_get.return_value = response
+
+        result = service._refresh_single_calendar(feed)
+
+        assert result["status"] == "error"
+        assert "above the limit" in result["error"]
+        # Reading stopped with the chunk that went past the limit
+        assert len(chunks) == 3
+        response.close.assert_called_once()
+        assert feed.calendar is None
+
+    @patch("requests.get")
+    def test_refresh_releases_failed_response(self, mock_get):
+        """Test that a response with an error status is released"""
+        service = MultiCalendarService([])
+        service.stop()
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+
+        response = _feed_response(status_code=500)
+        response.raise_for_status.side_effect = requests.HTTPError(
+            "500 Server Error", response=response
+        )
+        mock_get.return_value = response
+
+        result = service._refresh_single_calendar(feed)
+
+        assert result["status"] == "error"
+        assert "HTTP error 500" in result["error"]
+        response.iter_content.assert_not_called()
+        response.close.assert_called_once()
+
+    @patch("requests.get")
+    def test_refresh_defers_event_conversion(self, mock_get, sample_ical_data):
+        """Test that events are converted on first query, not on refresh"""
+        service = MultiCalendarService([])
+        service.stop()
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        service.feeds[feed.id] = feed
+
+        mock_get.return_value = _feed_response(sample_ical_data.encode())
+        result = service._refresh_single_calendar(feed)
+
+        assert result["event_count"] == 2
+        assert feed.parsed is None
+
+        assert len(service.search_events("event")) == 2
+        assert len(feed.parsed.events) == 2
+
     # ========== EVENT RETRIEVAL TESTS ==========
 
     @patch("recurring_ical_events.of")
@@ -314,6 +706,615 @@ class TestMultiCalendarService:
         for event in events:
             assert "Meeting" in event["summary"]
 
+    def test_search_events_variations_stay_within_fields(self):
+        """Test that query variations match per field and not across fields"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        for summary, location in [("Team_sync", "Room 1"), ("Planning", "Lab")]:
+            event = Event()
+            event.add("summary", summary)
+            event.add("location", location)
+            cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        assert [e["summary"] for e in service.search_events("team sync")] == [
+            "Team_sync"
+        ]
+        assert [e["summary"] for e in service.search_events("room-1")] == ["Team_sync"]
+        assert service.search_events("planninglab") == []
+        assert service.search_events("g.*") == []
+
+    def test_search_events_matches_feed_name(self):
+        """Test that a query naming a feed returns that feed's events"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        for name, summary in [("Work Calendar", "Standup"), ("Home", "Dinner")]:
+            feed = CalendarFeed(f"https://example.com/{name[:4]}.ics", name)
+            cal = Calendar()
+            event = Event()
+            event.add("summary", summary)
+            cal.add_component(event)
+            feed.calendar = cal
+            service.feeds[feed.id] = feed
+
+        _search_terms.cache_clear()
+        for _ in range(2):
+            events = service.search_events("Work_Calendar")
+            assert [e["summary"] for e in events] == ["Standup"]
+
+        # The query's variations are built once and reused
+        assert _search_terms.cache_info().hits == 1
+
+    def test_search_events_matches_within_one_event(self):
+        """Test that a search scans events together but matches each on its own"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        for summary, location in [("Plan", "Room B"), ("Another plan", "Lab")]:
+            event = Event()
+            event.add("summary", summary)
+            event.add("location", location)
+            cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        assert [e["summary"] for e in service.search_events("plan")] == [
+            "Plan",
+            "Another plan",
+        ]
+        assert [e["summary"] for e in service.search_events("lab")] == ["Another plan"]
+        # Texts are NUL-separated, a match may not run into the next event
+        assert service.search_events("room b\0another") == []
+        assert [e["summary"] for e in service.search_events("plan\0\0room")] == ["Plan"]
+
+    def test_search_events_sorted_by_start(self):
+        """Test that results are ordered by start, all-day events first in their day"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        for summary, start in [
+            ("Review late", datetime(2024, 1, 2, 9, 0, tzinfo=timezone.utc)),
+            ("Review all day", date(2024, 1, 2)),
+            ("Review undated", None),
+            ("Review early", datetime(2024, 1, 1, 23, 0, tzinfo=timezone.utc)),
+        ]:
+            event = Event()
+            event.add("summary", summary)
+            if start is not None:
+                event.add("dtstart", start)
+            cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        assert [e["summary"] for e in service.search_events("review")] == [
+            "Review undated",
+            "Review early",
+            "Review all day",
+            "Review late",
+        ]
+
+    def test_parsed_events_are_reused_until_calendar_changes(self):
+        """Test that VEVENTs are converted once per calendar and rebuilt on refresh"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        event = Event()
+        event.add("summary", "Standup")
+        event.add("dtstart", datetime(2099, 1, 1, 10, 0, 0, tzinfo=timezone.utc))
+        event.add("uid", "standup@example.com")
+        cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        with patch.object(
+            service, "_event_to_dict", wraps=service._event_to_dict
+        ) as mock_to_dict:
+            assert len(service.search_events("standup")) == 1
+            assert len(service.get_upcoming_events()) == 1
+            assert service.get_event_by_uid("standup@example.com") is not None
+            assert mock_to_dict.call_count == 1
+
+            # Assigning a new calendar drops the parsed events
+            feed.calendar = Calendar()
+            assert feed.parsed is None
+            assert service.search_events("standup") == []
+
+    def test_queries_do_not_wait_for_the_service_lock(self):
+        """Test that queries on a parsed feed run while the lock is held"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        event = Event()
+        event.add("summary", "Standup")
+        event.add("uid", "standup@example.com")
+        event.add("dtstart", datetime(2099, 1, 1, 10, 0, 0, tzinfo=timezone.utc))
+        cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+        service.search_events("warm up")
+
+        results = []
+
+        def query():
+            results.append(len(service.search_events("standup")))
+            results.append(service.get_event_by_uid("standup@example.com") is not None)
+            results.append(len(service.get_upcoming_events()))
+
+        with service._lock:
+            thread = threading.Thread(target=query)
+            thread.start()
+            thread.join(timeout=5)
+
+        assert results == [1, True, 1]
+
+    def test_get_upcoming_events_across_feeds(self):
+        """Test that upcoming events are merged across feeds in start order"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        for name, hours in [("Work", [3, 1]), ("Home", [2, -1])]:
+            feed = CalendarFeed(f"https://example.com/{name.lower()}.ics", name)
+            cal = Calendar()
+            for hour in hours:
+                event = Event()
+                event.add("summary", f"{name} {hour}")
+                event.add(
+                    "dtstart",
+                    datetime(2099, 1, 1, 10 + hour, 0, 0, tzinfo=timezone.utc),
+                )
+                cal.add_component(event)
+            feed.calendar = cal
+            service.feeds[feed.id] = feed
+
+        events = service.get_upcoming_events(count=3)
+
+        assert [e["summary"] for e in events] == ["Home -1", "Work 1", "Home 2"]
+
+    def test_get_event_by_uid(self):
+        """Test that UID lookups return the first matching event per feed order"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        for name in ["Work", "Home"]:
+            feed = CalendarFeed(f"https://example.com/{name.lower()}.ics", name)
+            cal = Calendar()
+            for uid in ["shared@example.com", f"{name.lower()}@example.com"]:
+                event = Event()
+                event.add("summary", f"{name} {uid}")
+                event.add("uid", uid)
+                cal.add_component(event)
+            feed.calendar = cal
+            service.feeds[feed.id] = feed
+
+        assert (
+            service.get_event_by_uid("shared@example.com")["summary"]
+            == "Work shared@example.com"
+        )
+        assert (
+            service.get_event_by_uid("shared@example.com", "Home")["source_feed_name"]
+            == "Home"
+        )
+        assert service.get_event_by_uid("home@example.com")["source_feed_name"] == (
+            "Home"
+        )
+        assert service.get_event_by_uid("missing@example.com") is None
+
+    def test_get_events_expands_only_nearby_single_events(self):
+        """Test that far-away single events are left out of recurrence expansion"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        for summary, start, rrule in [
+            ("Daily", datetime(2098, 1, 1, 9, 0, tzinfo=timezone.utc), True),
+            ("Nearby", datetime(2099, 1, 1, 10, 0, tzinfo=timezone.utc), False),
+            ("Far", datetime(2099, 6, 1, 10, 0, tzinfo=timezone.utc), False),
+        ]:
+            event = Event()
+            event.add("summary", summary)
+            event.add("uid", f"{summary.lower()}@example.com")
+            event.add("dtstart", start)
+            if rrule:
+                event.add("rrule", {"freq": "daily"})
+            cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        start = datetime(2099, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2099, 1, 2, tzinfo=timezone.utc)
+        candidates = service._feed_events(feed).expansion_candidates(start, end)
+        events = service.get_events(
+            start_date=start.isoformat(), end_date=end.isoformat()
+        )
+
+        assert [str(c["SUMMARY"]) for c in candidates] == ["Daily"]
+        assert [e["summary"] for e in events] == ["Daily", "Nearby"]
+        assert events[0]["start"] == "2099-01-01T09:00:00+00:00"
+
+    def test_get_today_events(self):
+        """Test that today's events are queried without going through get_events"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        today = datetime.now(timezone.utc).replace(
+            hour=12, minute=0, second=0, microsecond=0
+        )
+        for summary, start in [
+            ("Today", today),
+            ("Tomorrow", today + timedelta(days=1)),
+        ]:
+            event = Event()
+            event.add("summary", summary)
+            event.add("uid", f"{summary.lower()}@example.com")
+            event.add("dtstart", start)
+            cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        with patch.object(service, "get_events") as mock_get_events:
+            events = service.get_today_events(["Test"])
+
+        mock_get_events.assert_not_called()
+        assert [e["summary"] for e in events] == ["Today"]
+        with pytest.raises(ValueError):
+            service.get_today_events(["Missing"])
+
+    def test_day_resources_query_from_utc_midnight(self):
+        """Test that the tomorrow, week and month views pass datetimes directly"""
+        service = MultiCalendarService([])
+        service.stop()
+        today = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+
+        with patch.object(
+            service, "_get_events_impl", return_value=[]
+        ) as mock_impl, patch.object(service, "get_events") as mock_get_events:
+            tomorrow = service.get_tomorrow_events_resource()
+            week = service.get_week_events_resource()
+            month = service.get_month_events_resource()
+
+        mock_get_events.assert_not_called()
+        ranges = [c.args[:2] for c in mock_impl.call_args_list]
+        assert ranges[0] == (today + timedelta(days=1), today + timedelta(days=2))
+        assert ranges[1][0] == today - timedelta(days=today.weekday())
+        assert ranges[1][1] - ranges[1][0] == timedelta(days=7)
+        assert ranges[2][0] == today.replace(day=1)
+        assert tomorrow["date"] == (today + timedelta(days=1)).date().isoformat()
+        assert week["week_start"] == ranges[1][0].isoformat()
+        assert month["month_start"] == today.replace(day=1).isoformat()
+
+    def test_get_events_keeps_feed_order_for_equal_starts(self):
+        """Test that events starting together come back in feed order"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        start = datetime(2099, 1, 1, 10, 0, tzinfo=timezone.utc)
+        for name in ["First", "Second", "Third"]:
+            feed = CalendarFeed(f"https://example.com/{name.lower()}.ics", name)
+            cal = Calendar()
+            event = Event()
+            event.add("summary", "Shared")
+            event.add("uid", "shared@example.com")
+            event.add("dtstart", start)
+            event.add("rrule", {"freq": "daily", "count": 2})
+            cal.add_component(event)
+            feed.calendar = cal
+            service.feeds[feed.id] = feed
+
+        with patch.object(
+            service, "_expand_feed", wraps=service._expand_feed
+        ) as mock_expand:
+            events = service.get_events(
+                start_date="2099-01-01T00:00:00+00:00",
+                end_date="2099-01-03T00:00:00+00:00",
+            )
+
+        assert mock_expand.call_count == 3
+        assert [e["source_feed_name"] for e in events] == [
+            "First",
+            "Second",
+            "Third",
+        ] * 2
+
+    def test_event_resources_are_memoized_until_feeds_change(self):
+        """Test that resource results are reused until a feed's calendar changes"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        def calendar_with(summary):
+            cal = Calendar()
+            event = Event()
+            event.add("summary", summary)
+            event.add("dtstart", datetime(2099, 1, 1, 10, 0, tzinfo=timezone.utc))
+            cal.add_component(event)
+            return cal
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        feed.calendar = calendar_with("Before")
+        service.feeds[feed.id] = feed
+
+        with patch.object(
+            service, "get_events", wraps=service.get_events
+        ) as mock_get_events:
+            first = service.get_events_on_date_resource("2099-01-01")
+            second = service.get_events_on_date_resource("2099-01-01")
+            assert mock_get_events.call_count == 1
+            assert second is first
+
+            feed.calendar = calendar_with("After")
+            third = service.get_events_on_date_resource("2099-01-01")
+            assert mock_get_events.call_count == 2
+
+        assert [e["summary"] for e in first["events"]] == ["Before"]
+        assert [e["summary"] for e in third["events"]] == ["After"]
+        # Errors are not kept
+        service.get_events_on_date_resource("not-a-date")
+        assert len(service._resource_results) == 2
+
+    def test_get_conflicts_resource(self):
+        """Test that overlapping events are paired in event order"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        events = [
+            {"summary": "Holiday", "start": "2099-01-01", "end": "2099-01-02"},
+            {
+                "summary": "Long",
+                "start": "2099-01-01T09:00:00+00:00",
+                "end": "2099-01-01T12:00:00+00:00",
+            },
+            {
+                "summary": "Inside",
+                "start": "2099-01-01T10:00:00+00:00",
+                "end": "2099-01-01T10:30:00+00:00",
+            },
+            {
+                "summary": "Adjacent",
+                "start": "2099-01-01T12:00:00+00:00",
+                "end": "2099-01-01T13:00:00+00:00",
+            },
+            {
+                "summary": "Late",
+                "start": "2099-01-01T12:30:00+00:00",
+                "end": "2099-01-01T14:00:00+00:00",
+            },
+        ]
+
+        with patch.object(
+            service, "get_events", return_value=events
+        ) as mock_get_events:
+            timed = service.get_conflicts_resource()
+            with_all_day = service.get_conflicts_resource(include_all_day=True)
+            # Repeated queries reuse the analysis until a feed changes
+            assert service.get_conflicts_resource() is timed
+            assert mock_get_events.call_count == 2
+
+        def pairs(result):
+            return [
+                (c["event1"]["summary"], c["event2"]["summary"])
+                for c in result["conflicts"]
+            ]
+
+        assert pairs(timed) == [("Long", "Inside"), ("Adjacent", "Late")]
+        assert pairs(with_all_day) == [
+            ("Holiday", "Long"),
+            ("Holiday", "Inside"),
+            ("Holiday", "Adjacent"),
+            ("Holiday", "Late"),
+            ("Long", "Inside"),
+            ("Adjacent", "Late"),
+        ]
+        assert with_all_day["conflicts"][0]["conflict_type"] == "all_day_overlap"
+
+    @pytest.mark.parametrize(
+        "flag, expected", [("true", True), ("Yes", True), ("1", True), ("false", False)]
+    )
+    def test_analyze_conflicts_for_mcp_arguments(self, flag, expected):
+        """Test that the MCP wrapper converts and validates its string arguments"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        with patch.object(
+            service, "analyze_calendar_conflicts", return_value={}
+        ) as mock_analyze:
+            service.analyze_conflicts_for_mcp("30", flag, "15", "high")
+            result = service.analyze_conflicts_for_mcp(severity_threshold="urgent")
+
+        mock_analyze.assert_called_once_with(
+            days_ahead=30,
+            include_all_day=expected,
+            min_overlap_minutes=15,
+            severity_threshold="high",
+        )
+        assert result["help"] == "Must be one of: all, high, medium, low"
+
+    def test_analyze_conflicts_cached_by_feed_contents(self):
+        """Test that shared conflict results are keyed on the feed bodies"""
+        stored = {}
+        cache = MagicMock()
+        cache.set.side_effect = lambda key, value, ttl=None: stored.update({key: value})
+        cache.get.side_effect = lambda key: stored.get(key)
+
+        service = MultiCalendarService([], cache=cache)
+        service.stop()
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        feed.body_digest = b"first"
+        service.feeds[feed.id] = feed
+
+        with patch.object(service, "get_events", return_value=[]) as mock_get_events:
+            first = service.analyze_calendar_conflicts(days_ahead=3)
+            assert service.analyze_calendar_conflicts(days_ahead=3) == first
+            assert mock_get_events.call_count == 1
+
+            # Other arguments and other feed contents are analyzed anew
+            service.analyze_calendar_conflicts(days_ahead=4)
+            feed.body_digest = b"second"
+            service.analyze_calendar_conflicts(days_ahead=3)
+            assert mock_get_events.call_count == 3
+
+        assert len(stored) == 3
+
+    def test_conflicts_key_changes_at_utc_midnight(self):
+        """Test that a conflict analysis is not served across midnight"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        keys = []
+        with patch("src.services.ical.datetime") as mock_datetime:
+            for now in (
+                datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc),
+                datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc),
+                datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc),
+            ):
+                mock_datetime.now.return_value = now
+                keys.append(_conflicts_key(service, days_ahead=3))
+
+        assert keys[0] == keys[1]
+        assert keys[1] != keys[2]
+
+    def test_analyze_conflicts_checks_each_event_once(self):
+        """Test that all-day detection and parsing run once per event, not per pair"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        events = [
+            {
+                "uid": f"e{hour}",
+                "summary": f"Event {hour}",
+                "start": f"2099-01-01T{hour:02d}:00:00+00:00",
+                "end": f"2099-01-01T{hour + 2:02d}:00:00+00:00",
+            }
+            for hour in range(8, 12)
+        ]
+
+        with patch.object(service, "get_events", return_value=events), patch.object(
+            service, "_is_all_day_event", wraps=service._is_all_day_event
+        ) as mock_all_day, patch.object(
+            service, "_normalize_datetime", wraps=service._normalize_datetime
+        ) as mock_normalize:
+            result = service.analyze_calendar_conflicts(min_overlap_minutes=30)
+
+        assert mock_all_day.call_count == len(events)
+        # Start and end of each event, shared with all-day detection
+        assert mock_normalize.call_count == 2 * len(events)
+        assert [
+            (c["event1"]["id"], c["event2"]["id"]) for c in result["conflicts"]
+        ] == [("e8", "e9"), ("e9", "e10"), ("e10", "e11")]
+
+    def test_analyze_conflicts_ignores_nested_zero_length_event(self):
+        """Test that an instant inside another event is not a 0-minute conflict"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        events = [
+            {
+                "uid": "long",
+                "summary": "Long",
+                "start": "2099-10-20T00:00:00+00:00",
+                "end": "2099-10-22T02:00:00+00:00",
+            },
+            {
+                "uid": "instant",
+                "summary": "Instant",
+                "start": "2099-10-21T19:15:00+00:00",
+                "end": "2099-10-21T19:15:00+00:00",
+            },
+        ]
+
+        with patch.object(service, "get_events", return_value=events):
+            result = service.analyze_calendar_conflicts()
+
+        assert result["conflicts"] == []
+        assert result["summary"]["total_conflicts"] == 0
+
+    def test_get_events_single_events_match_expansion(self):
+        """Test that directly matched single events end where expansion ends them"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        start = datetime(2099, 1, 1, 10, 0, tzinfo=timezone.utc)
+        for summary, end, duration in [
+            ("Instant", None, None),
+            ("Timed", start + timedelta(hours=2), None),
+            ("Duration", None, timedelta(minutes=30)),
+        ]:
+            event = Event()
+            event.add("summary", summary)
+            event.add("uid", f"{summary.lower()}@example.com")
+            event.add("dtstart", start)
+            if end:
+                event.add("dtend", end)
+            if duration:
+                event.add("duration", duration)
+            cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        parsed = service._feed_events(feed)
+        events = service.get_events(
+            start_date="2099-01-01T10:00:00+00:00",
+            end_date="2099-01-01T11:00:00+00:00",
+        )
+
+        assert parsed.expansion_candidates(start, start + timedelta(hours=1)) == []
+        assert {e["summary"]: e["end"] for e in events} == {
+            "Instant": "2099-01-01T10:00:00+00:00",
+            "Timed": "2099-01-01T12:00:00+00:00",
+            "Duration": "2099-01-01T10:30:00+00:00",
+        }
+        # Zero-length events are excluded at the (exclusive) end of the range
+        assert [
+            e["summary"]
+            for e in service.get_events(
+                start_date="2099-01-01T09:00:00+00:00",
+                end_date="2099-01-01T10:00:00+00:00",
+            )
+        ] == []
+
+    def test_feeds_list_counts_events_only(self):
+        """Test that the feeds list reports VEVENTs, not every calendar component"""
+        service = MultiCalendarService([])
+        service.stop()
+
+        feed = CalendarFeed("https://example.com/test.ics", "Test")
+        cal = Calendar()
+        cal.add_component(Timezone())
+        for summary in ["One", "Two"]:
+            event = Event()
+            event.add("summary", summary)
+            cal.add_component(event)
+        feed.calendar = cal
+        service.feeds[feed.id] = feed
+
+        with patch.object(
+            service, "_event_to_dict", wraps=service._event_to_dict
+        ) as mock_to_dict:
+            feeds = service.get_feeds_list_resource()["feeds"]
+            service.get_calendar_info()
+
+        # Counting events does not convert them
+        assert feeds[0]["event_count"] == 2
+        mock_to_dict.assert_not_called()
+
     @patch("recurring_ical_events.of")
     def test_get_events_with_pagination(self, mock_recurring):
         """Test getting events with pagination"""
@@ -417,3 +1418,69 @@ class TestMultiCalendarService:
         # Cleanup
         if service._refresh_timer:
             service._refresh_timer.cancel()
+
+    @patch("src.services.ical.MultiCalendarService.refresh_all_calendars")
+    def test_auto_refresh_skips_when_refresh_in_progress(self, mock_refresh):
+        """Test that an auto-refresh tick is dropped while a refresh is running"""
+        service = MultiCalendarService([], refresh_interval_minutes=60)
+        service.stop()
+        mock_refresh.reset_mock()
+
+        # Simulate a refresh in progress on another thread
+        holder = threading.Thread(target=service._refresh_lock.acquire)
+        holder.start()
+        holder.join()
+
+        service._auto_refresh()
+
+        mock_refresh.assert_not_called()
+
+    def test_refresh_feeds_for_mcp_runs_in_background(self):
+        """Test that the refresh tool answers before the refresh finishes"""
+        service = MultiCalendarService([])
+        service.stop()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_refresh():
+            started.set()
+            release.wait(1)
+
+        threads = []
+
+        def start_thread(**kwargs):
+            thread = threading.Thread(**kwargs)
+            threads.append(thread)
+            return thread
+
+        with patch.object(
+            service, "refresh_all_calendars", side_effect=slow_refresh
+        ) as mock_refresh, patch("src.services.ical.Thread", side_effect=start_thread):
+            result = service.refresh_feeds_for_mcp()
+            assert result["success"] is True
+            assert "feeds" in result
+            assert started.wait(1)
+
+            # A second request joins the refresh already running
+            service.refresh_feeds_for_mcp()
+            threads[1].join(1)
+            release.set()
+            threads[0].join(1)
+
+        mock_refresh.assert_called_once()
+
+    def test_repeating_timer_fires_until_cancelled(self):
+        """Test that one timer thread runs the function on every interval"""
+        calls = threading.Semaphore(0)
+        timer = RepeatingTimer(0.01, calls.release)
+        timer.daemon = True
+        timer.start()
+
+        try:
+            assert calls.acquire(timeout=1)
+            assert calls.acquire(timeout=1)
+        finally:
+            timer.cancel()
+            timer.join(1)
+
+        assert not timer.is_alive()
@@ -0,0 +1,278 @@
+"""Tests for the remote server ASGI middlewares"""
+
+import asyncio
+import json
+import threading
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import server_remote
+
+
+def _run_asgi(app, path="/", method="GET"):
+    """Run a single HTTP request through an ASGI app and collect sent messages"""
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+def _make_app(response_headers):
+    """Create a minimal ASGI app returning the given raw headers"""
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": list(response_headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def test_security_middleware_adds_headers():
+    """Test that security headers are added to the response"""
+    app = server_remote.SecurityMiddleware(
+        _make_app([(b"content-type", b"text/plain")])
+    )
+
+    start, body = _run_asgi(app)
+    headers = dict(start["headers"])
+
+    assert headers[b"x-content-type-options"] == b"nosniff"
+    assert headers[b"x-frame-options"] == b"DENY"
+    assert headers[b"x-xss-protection"] == b"1; mode=block"
+    assert headers[b"referrer-policy"] == b"no-referrer"
+    assert headers[b"cache-control"] == b"no-store, no-cache, must-revalidate, private"
+    assert headers[b"content-type"] == b"text/plain"
+
+    # Body messages pass through untouched
+    assert body == {"type": "http.response.body", "body": b"ok"}
+
+
+def test_security_middleware_strips_server_headers():
+    """Test that server identification headers are removed"""
+    app = server_remote.SecurityMiddleware(
+        _make_app([(b"server", b"uvicorn"), (b"x-powered-by", b"python")])
+    )
+
+    start, _ = _run_asgi(app)
+    header_names = [name for name, _ in start["headers"]]
+
+    assert b"server" not in header_names
+    assert b"x-powered-by" not in header_names
+
+
+def test_security_middleware_replaces_existing_security_headers():
+    """Test that upstream security headers are replaced rather than duplicated"""
+    app = server_remote.SecurityMiddleware(_make_app([(b"cache-control", b"no-cache")]))
+
+    start, _ = _run_asgi(app)
+    cache_control = [
+        value for name, value in start["headers"] if name == b"cache-control"
+    ]
+
+    assert cache_control == [b"no-store, no-cache, must-revalidate, private"]
+
+
+def test_security_middleware_streams_body_chunks_unchanged():
+    """Test that streamed body chunks are forwarded as-is, one send per chunk"""
+    chunks = [
+        {"type": "http.response.body", "body": b"event: 1\n\n", "more_body": True},
+        {"type": "http.response.body", "body": b"event: 2\n\n", "more_body": True},
+        {"type": "http.response.body", "body": b"", "more_body": False},
+    ]
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for chunk in chunks:
+            await send(chunk)
+
+    app = server_remote.SecurityMiddleware(streaming_app)
+
+    start, *body = _run_asgi(app)
+
+    assert start["type"] == "http.response.start"
+    assert len(body) == len(chunks)
+    assert all(sent is chunk for sent, chunk in zip(body, chunks))
+
+
+def test_lazy_init_middleware_skips_health_check():
+    """Test that the health check does not trigger service initialization"""
+    app = server_remote.LazyInitMiddleware(_make_app([]))
+
+    with patch.object(server_remote, "lazy_initialize_services") as mock_init:
+        _run_asgi(app, path="/app/health")
+        mock_init.assert_not_called()
+
+        _run_asgi(app, path="/app/some/other/path")
+        mock_init.assert_called_once()
+
+
+def test_lazy_init_middleware_skips_once_initialized():
+    """Test that no initialization is attempted after services are initialized"""
+    app = server_remote.LazyInitMiddleware(_make_app([]))
+
+    with patch.object(server_remote, "_services_initialized", True), patch.object(
+        server_remote, "lazy_initialize_services"
+    ) as mock_init:
+        _run_asgi(app, path="/app/some/other/path")
+        mock_init.assert_not_called()
+
+
+def test_lazy_initialize_services_runs_once_under_concurrency():
+    """Test that concurrent cold-path callers initialize services only once"""
+    calls = []
+    gate = threading.Event()
+
+    def slow_initialize():
+        calls.append(1)
+        gate.wait(1)
+
+    with patch.object(server_remote, "_services_initialized", False), patch(
+        "src.server.initialize_services", side_effect=slow_initialize
+    ):
+        threads = [
+            threading.Thread(target=server_remote.lazy_initialize_services)
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert server_remote._services_initialized is True
+
+    assert len(calls) == 1
+
+
+def test_health_check_middleware_answers_directly():
+    """Test that health checks are answered without reaching the wrapped app"""
+    inner = MagicMock()
+    app = server_remote.HealthCheckMiddleware(inner)
+
+    start, body = _run_asgi(app, path="/app/health")
+    headers = dict(start["headers"])
+
+    inner.assert_not_called()
+    assert start["status"] == 200
+    assert headers[b"content-type"] == b"application/json"
+    assert headers[b"content-length"] == str(len(body["body"])).encode()
+    assert headers[b"x-frame-options"] == b"DENY"
+    assert json.loads(body["body"]) == {
+        "status": "healthy",
+        "initialized": False,
+        "version": "2.0.0",
+    }
+
+
+def test_health_check_middleware_reports_initialized():
+    """Test that the health check reflects the initialization state"""
+    app = server_remote.HealthCheckMiddleware(MagicMock())
+
+    with patch.object(server_remote, "_services_initialized", True):
+        _, body = _run_asgi(app, path="/app/health")
+
+    assert json.loads(body["body"])["initialized"] is True
+
+
+def test_health_check_middleware_passes_through_other_paths():
+    """Test that non-health requests reach the wrapped app"""
+    app = server_remote.HealthCheckMiddleware(_make_app([]))
+
+    _, body = _run_asgi(app, path="/app/other")
+    assert body["body"] == b"ok"
+
+    _, body = _run_asgi(app, path="/app/health", method="POST")
+    assert body["body"] == b"ok"
+
+
+def test_mcp_mount_middleware_dispatches_prefix():
+    """Test that paths below the prefix go to the MCP app with root_path set"""
+    scopes = []
+
+    async def mcp_app(scope, receive, send):
+        scopes.append(scope)
+        await _make_app([])(scope, receive, send)
+
+    fallback = MagicMock()
+    app = server_remote.MCPMountMiddleware(fallback, mcp_app, "/app/key/hash")
+
+    _, body = _run_asgi(app, path="/app/key/hash/mcp")
+
+    fallback.assert_not_called()
+    assert body["body"] == b"ok"
+    assert scopes[0]["path"] == "/app/key/hash/mcp"
+    assert scopes[0]["root_path"] == "/app/key/hash"
+
+
+@pytest.mark.parametrize(
+    "path", ["/app/key/hash", "/app/key/hashx/mcp", "/app/key/wrong/mcp", "/other"]
+)
+def test_mcp_mount_middleware_falls_back(path):
+    """Test that paths outside the prefix reach the wrapped app"""
+    mcp_app = MagicMock()
+    app = server_remote.MCPMountMiddleware(_make_app([]), mcp_app, "/app/key/hash")
+
+    _, body = _run_asgi(app, path=path)
+
+    mcp_app.assert_not_called()
+    assert body["body"] == b"ok"
+
+
+def test_not_found_logging_is_rate_limited():
+    """Test that invalid-path warnings are limited to one per interval"""
+    with patch.object(server_remote, "_last_not_found_log", 0.0), patch.object(
+        server_remote.time, "monotonic", side_effect=[100.0, 100.5, 101.0]
+    ):
+        assert server_remote._should_log_not_found() is True
+        assert server_remote._should_log_not_found() is False
+        assert server_remote._should_log_not_found() is True
+
+
+def test_service_warmup_runs_alongside_lifespan():
+    """Test that the warmup lifespan initializes services and enters the inner lifespan"""
+    events = []
+
+    @asynccontextmanager
+    async def inner(app):
+        events.append("enter")
+        yield {"state": True}
+        events.append("exit")
+
+    async def run():
+        async with server_remote.with_service_warmup(inner)(None) as state:
+            assert state == {"state": True}
+
+    with patch.object(
+        server_remote, "lazy_initialize_services"
+    ) as mock_init, patch.object(server_remote.threading, "Thread") as mock_thread:
+        asyncio.run(run())
+        mock_thread.call_args.kwargs["target"]()
+
+    mock_thread.return_value.start.assert_called_once()
+    mock_init.assert_called_once()
+    assert events == ["enter", "exit"]
+
+
+def test_service_warmup_logs_failures():
+    """Test that background initialization errors are logged, not raised"""
+    with patch.object(
+        server_remote, "lazy_initialize_services", side_effect=RuntimeError("boom")
+    ), patch.object(server_remote.logger, "error") as mock_error:
+        server_remote._warm_services()
+
+    mock_error.assert_called_once()